@@ -43,17 +43,50 @@ import json
 import argparse
 import subprocess
 import re
+import string
+import time
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional dependencies are imported once here; helpers that need a missing
+# package exit with an install hint via _require(). psycopg2 is imported by
+# check_lakebase_connection only, so REST-only actions don't pay for it.
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
+# Matches `- name: KEY` env entries in app.yaml and their quoted `value:`,
+# skipping intermediate keys such as `description:`
+_APP_YAML_ENV_RE = re.compile(
+    r'-\s*name:\s*(\w+)[ \t]*\n(?:[ \t]+(?!value:)\w+:.*\n)*?[ \t]+value:\s*"([^"]*)"'
+)
+
+
 class Config:
     """Configuration for Lakebase management."""
     
     # Databricks workspace
     DATABRICKS_HOST = os.getenv("DATABRICKS_HOST", "https://e2-demo-field-eng.cloud.databricks.com")
+    DATABRICKS_HOST_NETLOC = urlsplit(DATABRICKS_HOST).netloc or DATABRICKS_HOST
     
     # Lakebase instance settings (loaded from app.yaml)
     LAKEBASE_HOST = None
@@ -69,6 +102,8 @@ class Config:
     @classmethod
     def load_from_app_yaml(cls, project_root: str = "."):
         """Load configuration from app.yaml."""
+        cls.DATABRICKS_HOST_NETLOC = urlsplit(cls.DATABRICKS_HOST).netloc or cls.DATABRICKS_HOST
+        
         app_yaml_path = os.path.join(project_root, "app.yaml")
         
         if not os.path.exists(app_yaml_path):
@@ -78,15 +113,37 @@ class Config:
         with open(app_yaml_path, 'r') as f:
             content = f.read()
         
-        def get_yaml_value(key):
-            match = re.search(rf'name: {key}.*?value:\s*"([^"]*)"', content, re.DOTALL)
-            return match.group(1) if match else None
+        env = cls._parse_app_yaml_env(content)
+        
+        cls.LAKEBASE_HOST = env.get('LAKEBASE_HOST')
+        cls.LAKEBASE_DATABASE = env.get('LAKEBASE_DATABASE')
+        cls.LAKEBASE_SCHEMA = env.get('LAKEBASE_SCHEMA')
+        cls.LAKEBASE_PORT = int(env.get('LAKEBASE_PORT') or '443')
+        cls.LAKEBASE_USER = env.get('LAKEBASE_USER')
+    
+    @staticmethod
+    def _parse_app_yaml_env(content: str) -> Dict[str, Optional[str]]:
+        """
+        Parse the `env` entries of app.yaml into a name -> value dict.
+        
+        Uses PyYAML when available; otherwise, or when the file does not
+        parse as a mapping with an `env` list, falls back to a single regex
+        pass over the raw text.
+        """
+        if yaml is not None:
+            try:
+                doc = yaml.safe_load(content) or {}
+            except yaml.YAMLError:
+                doc = None
+            env = (doc.get("env") or []) if isinstance(doc, dict) else None
+            if isinstance(env, list):
+                return {
+                    e["name"]: None if e.get("value") is None else str(e["value"])
+                    for e in env
+                    if isinstance(e, dict) and "name" in e
+                }
         
-        cls.LAKEBASE_HOST = get_yaml_value('LAKEBASE_HOST')
-        cls.LAKEBASE_DATABASE = get_yaml_value('LAKEBASE_DATABASE')
-        cls.LAKEBASE_SCHEMA = get_yaml_value('LAKEBASE_SCHEMA')
-        cls.LAKEBASE_PORT = int(get_yaml_value('LAKEBASE_PORT') or '443')
-        cls.LAKEBASE_USER = get_yaml_value('LAKEBASE_USER')
+        return dict(_APP_YAML_ENV_RE.findall(content))
     
     @classmethod
     def to_dict(cls) -> Dict[str, Any]:
@@ -106,74 +163,343 @@ class Config:
 # HELPERS
 # =============================================================================
 
-def get_databricks_token(host: str) -> Optional[str]:
-    """Get OAuth token from Databricks CLI."""
-    try:
-        result = subprocess.run(
-            ['databricks', 'auth', 'token', '--host', host],
-            capture_output=True, text=True, check=True
+def _require(module, package: str) -> None:
+    """Exit with an install hint if an optional dependency is missing."""
+    if module is None:
+        raise SystemExit(
+            f"❌ Missing required package: {package}\n"
+            f"   Install with: pip install {package}"
         )
-        token_data = json.loads(result.stdout)
-        return token_data.get('access_token')
-    except Exception as e:
-        print(f"❌ Failed to get auth token: {e}")
-        print(f"   Run: databricks auth login --host {host}")
-        return None
 
 
-def get_app_service_principal(host: str, token: str, app_name: str) -> Tuple[Optional[str], Optional[str]]:
+# (connect, read) timeouts in seconds for Databricks REST calls
+HTTP_TIMEOUT = (5, 30)
+# Background cache refreshes get one short attempt so they never hold up exit
+REFRESH_TIMEOUT = (3, 5)
+
+_SESSION = None
+
+
+def _build_retry():
     """
-    Get the app's service principal ID and name.
+    Build the retry policy for Databricks REST calls.
     
-    Returns:
-        Tuple of (service_principal_id, service_principal_name)
+    Retries 429 and 5xx responses with exponential backoff (capped at 30 s,
+    with jitter on urllib3 2.x) and honors Retry-After up to the same cap,
+    since urllib3 does not apply backoff_max to it. GET and the
+    idempotent PATCH calls are retried on any listed status; a 429 is retried
+    for every method since the server did not process the request.
     """
-    import requests
+    import inspect
+    from urllib3.util.retry import Retry
+    
+    class _DatabricksRetry(Retry):
+        def is_retry(self, method, status_code, has_retry_after=False):
+            if status_code == 429 and self.total:
+                return True
+            return super().is_retry(method, status_code, has_retry_after)
+        
+        def get_retry_after(self, response):
+            retry_after = super().get_retry_after(response)
+            return None if retry_after is None else min(retry_after, 30)
+    
+    kwargs = dict(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"PATCH"},
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    params = inspect.signature(Retry.__init__).parameters
+    if "backoff_jitter" in params:
+        kwargs.update(backoff_jitter=0.5, backoff_max=30)
+    return _DatabricksRetry(**kwargs)
+
+
+def _get_session():
+    """
+    Get the shared HTTP session for Databricks REST calls.
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    The session is created on first use so keep-alive connections are reused
+    across calls to the same workspace. Throttled and transient server
+    errors are retried per _build_retry().
+    """
+    global _SESSION
+    if _SESSION is None:
+        _require(requests, "requests")
+        from requests.adapters import HTTPAdapter
+        
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=_build_retry())
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", adapter)
+        _SESSION.mount("http://", adapter)
+        _SESSION.headers.update({"Content-Type": "application/json"})
+    return _SESSION
+
+
+def _auth(token: str) -> Dict[str, str]:
+    """Build the Authorization header for a Databricks OAuth token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+# Token and app info are cached on disk between CLI runs
+CACHE_PATH = os.path.expanduser("~/.cache/lakebase_manager.json")
+APP_INFO_TTL_SECONDS = 300
+# Older entries are not served while refreshing; they are fetched synchronously
+APP_INFO_MAX_STALE_SECONDS = 4 * APP_INFO_TTL_SECONDS
+TOKEN_MIN_REMAINING_SECONDS = 60
+
+_cache_lock = threading.Lock()
+
+
+def _load_cache() -> Dict[str, Any]:
+    """Load the on-disk cache, returning an empty cache if missing or unreadable."""
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cache = _json_loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: Dict[str, Any]) -> None:
+    """Persist the cache with owner-only permissions (it holds OAuth tokens)."""
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        fd = os.open(CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, "fchmod"):
+            # The mode above only applies when the file is created
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _update_cache(section: str, key: str, value: Optional[Dict[str, Any]]) -> None:
+    """Set (or remove, when value is None) a single cache entry."""
+    with _cache_lock:
+        cache = _load_cache()
+        entries = cache.setdefault(section, {})
+        if value is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = value
+        _save_cache(cache)
+
+
+def _token_expiry(token: str, token_data: Optional[Dict[str, Any]] = None) -> float:
+    """
+    Get a token's expiry as a Unix timestamp, or 0 if unknown.
     
+    Reads the JWT `exp` claim, falling back to the `expiry` field of the
+    `databricks auth token` output.
+    """
     try:
-        response = requests.get(f"{host}/api/2.0/apps/{app_name}", headers=headers)
-        if response.status_code == 200:
-            app_info = response.json()
-            return (
-                app_info.get('service_principal_client_id'),
-                app_info.get('service_principal_name')
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(_json_loads(base64.urlsafe_b64decode(payload))['exp'])
+    except Exception:
+        pass
+    try:
+        from datetime import datetime
+        expiry = (token_data or {})['expiry']
+        # Trim sub-second digits so Python 3.10's fromisoformat accepts it
+        expiry = re.sub(r'(\.\d{1,6})\d*', r'\1', expiry).replace('Z', '+00:00')
+        return datetime.fromisoformat(expiry).timestamp()
+    except Exception:
+        return 0.0
+
+
+def _app_cache_key(host: str, app_name: str) -> str:
+    return f"{host}|{app_name}"
+
+
+def invalidate_app_info(host: str, app_name: str) -> None:
+    """Drop cached app info after the app has been modified."""
+    _update_cache("app_info", _app_cache_key(host, app_name), None)
+    _sp_memo.clear()
+
+
+# Tokens already fetched in this process, keyed by host
+_token_memo: Dict[str, Dict[str, Any]] = {}
+
+
+def _token_is_fresh(entry: Optional[Dict[str, Any]]) -> bool:
+    return bool(entry) and entry.get("expiry", 0) - time.time() > TOKEN_MIN_REMAINING_SECONDS
+
+
+def get_cached_databricks_token(host: str) -> Optional[str]:
+    """Return a still-fresh token from this process or the disk cache, without the CLI."""
+    entry = _token_memo.get(host)
+    if not _token_is_fresh(entry):
+        entry = _load_cache().get("tokens", {}).get(host)
+    if _token_is_fresh(entry):
+        _token_memo[host] = entry
+        return entry.get("access_token")
+    return None
+
+
+def get_databricks_token(host: str) -> Optional[str]:
+    """
+    Get OAuth token from Databricks CLI.
+    
+    Tokens are reused from this process or the on-disk cache while they have
+    more than a minute left before they expire, avoiding a CLI subprocess on
+    every call. The CLI is asked by host first, then by the profile named in
+    DATABRICKS_CONFIG_PROFILE if that is set.
+    """
+    cached = get_cached_databricks_token(host)
+    if cached:
+        return cached
+    
+    attempts = [['--host', host]]
+    profile = os.getenv("DATABRICKS_CONFIG_PROFILE")
+    if profile:
+        attempts.append(['--profile', profile])
+    
+    error = None
+    for target in attempts:
+        try:
+            # stdin is closed so a CLI waiting on a prompt fails instead of hanging;
+            # the environment is inherited because the CLI reads HOME and DATABRICKS_*
+            result = subprocess.run(
+                ['databricks', 'auth', 'token', *target],
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, check=True, timeout=30
             )
-        else:
-            print(f"⚠️  Could not get app info: {response.status_code}")
-            return None, None
-    except Exception as e:
-        print(f"❌ Error getting app info: {e}")
+            token_data = _json_loads(result.stdout)
+            access_token = token_data.get('access_token')
+            if not access_token:
+                error = "no access_token in CLI output"
+                continue
+            entry = {
+                "access_token": access_token,
+                "expiry": _token_expiry(access_token, token_data),
+            }
+            _token_memo[host] = entry
+            _update_cache("tokens", host, entry)
+            return access_token
+        except Exception as e:
+            error = e
+    
+    print(f"❌ Failed to get auth token: {error}")
+    print(f"   Run: databricks auth login --host {host}")
+    return None
+
+
+def get_app_service_principal(host: str, token: str, app_name: str,
+                              app_info: Optional[Dict[str, Any]] = None,
+                              fresh: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the app's service principal ID and name.
+    
+    Args:
+        app_info: App record already fetched with get_full_app_info; when
+            given, the fields are read from it without another request
+        fresh: Bypass the on-disk app info cache; use when the principal is
+            about to be granted permissions
+    
+    Returns:
+        Tuple of (service_principal_id, service_principal_name)
+    """
+    if app_info is not None:
+        return (
+            app_info.get('service_principal_client_id'),
+            app_info.get('service_principal_name')
+        )
+    return _get_app_service_principal_cached(host, token, app_name, fresh)
+
+
+# Service principals already looked up in this process; failures are not kept
+_sp_memo: Dict[Tuple[str, str, str], Tuple[Optional[str], Optional[str]]] = {}
+
+
+def _get_app_service_principal_cached(host: str, token: str, app_name: str,
+                                      fresh: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """Memoized service principal lookup for repeated calls within one run."""
+    key = (host, token, app_name)
+    if not fresh and key in _sp_memo:
+        return _sp_memo[key]
+    app_info = get_full_app_info(host, token, app_name, fresh=fresh)
+    if not app_info:
         return None, None
+    result = get_app_service_principal(host, token, app_name, app_info)
+    if result[0]:
+        _sp_memo[key] = result
+    return result
 
 
-def get_full_app_info(host: str, token: str, app_name: str) -> Optional[Dict[str, Any]]:
+def get_full_app_info(host: str, token: str, app_name: str,
+                      fresh: bool = False) -> Optional[Dict[str, Any]]:
     """
     Get full app information including URL and status.
     
+    Results are cached for APP_INFO_TTL_SECONDS. An entry up to
+    APP_INFO_MAX_STALE_SECONDS old is returned immediately while a background
+    thread refreshes it for the next run; anything older is fetched again.
+    
+    Args:
+        fresh: Skip the cache; use when the result decides whether to write
+    
     Returns:
         Dict with app info or None
     """
-    import requests
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    if not fresh:
+        cached = _load_cache().get("app_info", {}).get(_app_cache_key(host, app_name))
+        age = time.time() - (cached or {}).get("fetched_at", 0)
+        if cached and age <= APP_INFO_MAX_STALE_SECONDS:
+            if age > APP_INFO_TTL_SECONDS:
+                # Non-daemon so the refresh finishes after the action's output is printed
+                # and the cache write is never cut off mid-file; it makes a single
+                # short attempt, so it delays exit by at most REFRESH_TIMEOUT
+                threading.Thread(
+                    target=_fetch_app_info, args=(host, token, app_name),
+                    kwargs={"background": True}
+                ).start()
+            return cached.get("data")
+    
+    return _fetch_app_info(host, token, app_name)
+
+
+def _fetch_app_info(host: str, token: str, app_name: str,
+                    background: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Fetch app information from the REST API and refresh the cache.
     
+    A background refresh is silent and makes one attempt without retries,
+    bounded by REFRESH_TIMEOUT, instead of using the shared retrying session.
+    """
     try:
-        response = requests.get(f"{host}/api/2.0/apps/{app_name}", headers=headers)
+        if background:
+            _require(requests, "requests")
+            response = requests.get(
+                f"{host}/api/2.0/apps/{app_name}",
+                headers=_auth(token),
+                timeout=REFRESH_TIMEOUT
+            )
+        else:
+            response = _get_session().get(
+                f"{host}/api/2.0/apps/{app_name}",
+                headers=_auth(token),
+                timeout=HTTP_TIMEOUT
+            )
         if response.status_code == 200:
-            return response.json()
+            app_info = _json_loads(response.content)
+            _update_cache("app_info", _app_cache_key(host, app_name), {
+                "fetched_at": time.time(),
+                "data": app_info,
+            })
+            return app_info
+        elif background:
+            return None
         else:
             print(f"⚠️  Could not get app info: {response.status_code}")
             return None
     except Exception as e:
-        print(f"❌ Error getting app info: {e}")
+        if not background:
+            print(f"❌ Error getting app info: {e}")
         return None
 
 
@@ -190,13 +516,6 @@ def grant_catalog_permissions(host: str, token: str, catalog_name: str, principa
     Returns:
         True if successful, False otherwise
     """
-    import requests
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "changes": [
             {
@@ -207,9 +526,10 @@ def grant_catalog_permissions(host: str, token: str, catalog_name: str, principa
     }
     
     try:
-        response = requests.patch(
+        response = _get_session().patch(
             f"{host}/api/2.1/unity-catalog/permissions/catalog/{catalog_name}",
-            headers=headers,
+            headers=_auth(token),
+            timeout=HTTP_TIMEOUT,
             json=payload
         )
         
@@ -237,26 +557,21 @@ def deploy_app_source(host: str, token: str, app_name: str, source_path: str) ->
     Returns:
         True if successful, False otherwise
     """
-    import requests
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "source_code_path": source_path
     }
     
     try:
-        response = requests.post(
+        response = _get_session().post(
             f"{host}/api/2.0/apps/{app_name}/deployments",
-            headers=headers,
+            headers=_auth(token),
+            timeout=HTTP_TIMEOUT,
             json=payload
         )
         
         if response.status_code in [200, 201]:
-            result = response.json()
+            invalidate_app_info(host, app_name)
+            result = _json_loads(response.content)
             status = result.get('status', {}).get('state', 'UNKNOWN')
             print(f"   Deployment status: {status}")
             return True
@@ -286,13 +601,6 @@ def add_lakebase_role(host: str, token: str, instance_name: str, principal_id: s
     Returns:
         True if successful, False otherwise
     """
-    import requests
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "name": principal_id,
         "identity_type": identity_type,
@@ -300,14 +608,15 @@ def add_lakebase_role(host: str, token: str, instance_name: str, principal_id: s
     }
     
     try:
-        response = requests.post(
+        response = _get_session().post(
             f"{host}/api/2.0/database/instances/{instance_name}/roles",
-            headers=headers,
+            headers=_auth(token),
+            timeout=HTTP_TIMEOUT,
             json=payload
         )
         
         if response.status_code in [200, 201]:
-            result = response.json()
+            result = _json_loads(response.content)
             print(f"   Role: {result.get('membership_role')}")
             print(f"   Identity Type: {result.get('identity_type')}")
             return True
@@ -335,21 +644,15 @@ def get_lakebase_roles(host: str, token: str, instance_name: str) -> list:
     Returns:
         List of role dictionaries
     """
-    import requests
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.get(
+        response = _get_session().get(
             f"{host}/api/2.0/database/instances/{instance_name}/roles",
-            headers=headers
+            headers=_auth(token),
+            timeout=HTTP_TIMEOUT
         )
         
         if response.status_code == 200:
-            return response.json().get('database_instance_roles', [])
+            return _json_loads(response.content).get('database_instance_roles', [])
         else:
             print(f"⚠️  Get roles returned: {response.status_code}")
             return []
@@ -362,6 +665,9 @@ def get_app_resources(host: str, token: str, app_name: str) -> list:
     """
     Get existing app resources for a Databricks App.
     
+    Always read from the API, not the app info cache: callers use the result
+    to decide whether a resource still needs to be linked.
+    
     Args:
         host: Databricks workspace URL
         token: OAuth token
@@ -370,7 +676,7 @@ def get_app_resources(host: str, token: str, app_name: str) -> list:
     Returns:
         List of resource dictionaries
     """
-    app_info = get_full_app_info(host, token, app_name)
+    app_info = get_full_app_info(host, token, app_name, fresh=True)
     if app_info:
         return app_info.get('resources', [])
     return []
@@ -396,13 +702,6 @@ def link_app_resource(host: str, token: str, app_name: str, instance_name: str,
     Returns:
         True if successful, False otherwise
     """
-    import requests
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "resources": [
             {
@@ -417,22 +716,19 @@ def link_app_resource(host: str, token: str, app_name: str, instance_name: str,
     }
     
     try:
-        response = requests.patch(
+        response = _get_session().patch(
             f"{host}/api/2.0/apps/{app_name}",
-            headers=headers,
+            headers=_auth(token),
+            timeout=HTTP_TIMEOUT,
             json=payload
         )
         
         if response.status_code == 200:
-            result = response.json()
-            resources = result.get('resources', [])
-            for r in resources:
-                db = r.get('database', {})
-                if db.get('instance_name') == instance_name:
-                    print(f"   Instance: {db.get('instance_name')}")
-                    print(f"   Database: {db.get('database_name')}")
-                    print(f"   Permission: {db.get('permission')}")
-                    return True
+            invalidate_app_info(host, app_name)
+            db = payload["resources"][0]["database"]
+            print(f"   Instance: {db['instance_name']}")
+            print(f"   Database: {db['database_name']}")
+            print(f"   Permission: {db['permission']}")
             return True
         else:
             print(f"⚠️  Link app resource returned: {response.status_code}")
@@ -443,6 +739,42 @@ def link_app_resource(host: str, token: str, app_name: str, instance_name: str,
         return False
 
 
+_PG_POOL = None
+_PG_POOL_KEY = None
+
+
+def _get_pg_pool(config: Config, token: str):
+    """
+    Get a process-wide Postgres connection pool for the configured instance.
+    
+    The pool is rebuilt if the connection settings or OAuth token change,
+    since the token is the connection password.
+    """
+    global _PG_POOL, _PG_POOL_KEY
+    from psycopg2.pool import SimpleConnectionPool
+    
+    key = (config.LAKEBASE_HOST, config.LAKEBASE_PORT, config.LAKEBASE_DATABASE,
+           config.LAKEBASE_USER, token)
+    if _PG_POOL is None or _PG_POOL_KEY != key:
+        if _PG_POOL is not None:
+            _PG_POOL.closeall()
+        _PG_POOL = SimpleConnectionPool(
+            minconn=1,
+            maxconn=2,
+            host=config.LAKEBASE_HOST,
+            port=config.LAKEBASE_PORT,
+            database=config.LAKEBASE_DATABASE,
+            user=config.LAKEBASE_USER,
+            password=token,
+            sslmode='require',
+            keepalives=1,
+            connect_timeout=5,
+            options='-c statement_timeout=15000'
+        )
+        _PG_POOL_KEY = key
+    return _PG_POOL
+
+
 def check_lakebase_connection(config: Config, token: str) -> Tuple[bool, Dict[str, int]]:
     """
     Check Lakebase connectivity and return table counts.
@@ -450,37 +782,156 @@ def check_lakebase_connection(config: Config, token: str) -> Tuple[bool, Dict[st
     Returns:
         Tuple of (success: bool, table_counts: dict)
     """
-    import psycopg2
+    try:
+        from psycopg2 import sql
+    except ImportError:
+        return False, {"error": "psycopg2 not installed (pip install psycopg2-binary)"}
     
     if not config.LAKEBASE_HOST:
         return False, {"error": "LAKEBASE_HOST not configured"}
     
     try:
-        conn = psycopg2.connect(
-            host=config.LAKEBASE_HOST,
-            port=config.LAKEBASE_PORT,
-            database=config.LAKEBASE_DATABASE,
-            user=config.LAKEBASE_USER,
-            password=token,
-            sslmode='require'
-        )
-        cursor = conn.cursor()
-        
+        pool = _get_pg_pool(config, token)
+        conn = pool.getconn()
+    except Exception as e:
+        return False, {"error": str(e)}
+    
+    try:
         tables = ['usecase_descriptions', 'section_input_prompts', 'sessions']
         counts = {}
         
-        for table in tables:
+        def count_query(table: str) -> "sql.Composed":
+            return sql.SQL("SELECT {}, COUNT(*) FROM {}.{}").format(
+                sql.Literal(table),
+                sql.Identifier(config.LAKEBASE_SCHEMA),
+                sql.Identifier(table),
+            )
+        
+        with conn.cursor() as cursor:
+            # Count all tables in a single round trip
             try:
-                cursor.execute(f"SELECT COUNT(*) FROM {config.LAKEBASE_SCHEMA}.{table}")
-                counts[table] = cursor.fetchone()[0]
-            except Exception as e:
-                counts[table] = f"ERROR: {e}"
+                cursor.execute(sql.SQL(" UNION ALL ").join(count_query(t) for t in tables))
+                counts = dict(cursor.fetchall())
+            except Exception:
+                # A missing table fails the whole batch; count individually to
+                # report which table is at fault
+                conn.rollback()
+                for table in tables:
+                    try:
+                        cursor.execute(count_query(table))
+                        counts[table] = cursor.fetchone()[1]
+                    except Exception as e:
+                        conn.rollback()
+                        counts[table] = f"ERROR: {e}"
         
-        cursor.close()
-        conn.close()
+        # End the read transaction so the pooled connection is reusable
+        conn.rollback()
         return True, counts
     except Exception as e:
+        if not conn.closed:
+            # Don't hand a connection in an unknown state back to the pool
+            conn.close()
         return False, {"error": str(e)}
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+# =============================================================================
+# OUTPUT TEMPLATES
+# =============================================================================
+
+# Built once at import; actions fill them with string.Template.substitute()
+_PERMISSION_SETUP_TMPL = string.Template("""
+To grant the app access to Lakebase as superuser:
+
+1. Go to: ${host}
+2. Navigate to: Compute > Lakebase Postgres > ${instance}
+3. Click: Permissions tab
+4. Click: Add role
+5. Enter Service Principal ID: ${sp_id}
+6. Set Role membership: databricks_superuser
+7. Click: Confirm
+
+NOTE: Lakebase management APIs are not yet public.
+      Permission setup must be done via UI.
+""")
+
+_INSTRUCTIONS_TMPL = string.Template("""
+OPTION A: Using Databricks Asset Bundles (Recommended)
+======================================================
+Lakebase infrastructure can be managed via databricks.yml.
+Reference: https://github.com/databricks/bundle-examples/tree/main/knowledge_base/database_with_catalog
+
+STEP 1: Deploy Infrastructure with DAB
+--------------------------------------
+   # Validate the bundle configuration
+   databricks bundle validate
+   
+   # Deploy Lakebase instance + app
+   databricks bundle deploy -t development
+
+This creates:
+   - Lakebase PostgreSQL instance
+   - Catalog and database
+   - Databricks App
+
+STEP 2: Get App Service Principal
+---------------------------------
+After deployment, get the service principal:
+   python scripts/lakebase_manager.py --action app-info
+
+STEP 3: Add App Permission to Lakebase (Manual Step)
+----------------------------------------------------
+1. Navigate to: Compute > Lakebase Postgres > ${instance}
+2. Click: Permissions tab
+3. Click: Add role
+4. Enter Service Principal ID: ${sp_id}
+5. Set Role membership: databricks_superuser
+6. Click: Confirm
+
+STEP 4: Update app.yaml with Connection Details
+-----------------------------------------------
+Get connection details from:
+   Compute > Lakebase Postgres > ${instance} > Connection details
+
+Update app.yaml env vars:
+   LAKEBASE_HOST: <endpoint from connection details>
+   LAKEBASE_DATABASE: databricks_postgres
+
+STEP 5: Create Tables and Seed Data
+-----------------------------------
+   ./scripts/setup-lakebase.sh --recreate
+
+STEP 6: Redeploy App
+--------------------
+   databricks bundle deploy -t development
+
+
+OPTION B: Manual Setup (Alternative)
+====================================
+
+STEP 1: Create Lakebase Instance via UI
+---------------------------------------
+1. Go to: ${host}
+2. Navigate to: Compute > Lakebase Postgres
+3. Click: Create
+4. Enter name: ${instance}
+5. Click: Create
+
+STEP 2: Deploy App
+------------------
+   databricks apps deploy ${app_name} --source-code-path /Workspace/...
+
+STEP 3: Add Permission (same as Option A Step 3)
+
+STEP 4: Update app.yaml (same as Option A Step 4)
+
+STEP 5: Create Tables
+---------------------
+   ./scripts/setup-lakebase.sh --recreate
+
+Your app should now have full access to Lakebase!
+""")
 
 
 # =============================================================================
@@ -548,9 +999,32 @@ def action_status(config: Config) -> int:
     if not token:
         return 1
     
+    # App info and Lakebase connectivity are independent, so fetch them concurrently;
+    # a status check reports live deployment state, so it bypasses the cache
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        app_future = executor.submit(
+            get_full_app_info, config.DATABRICKS_HOST, token, config.APP_NAME, fresh=True
+        )
+        conn_future = executor.submit(check_lakebase_connection, config, token)
+    
+    # The app record carries the service principal, status and resources
+    try:
+        app_info = app_future.result()
+    except Exception as e:
+        print(f"❌ Error getting app info: {e}")
+        app_info = None
+    sp_id, sp_name = (
+        get_app_service_principal(config.DATABRICKS_HOST, token, config.APP_NAME, app_info)
+        if app_info else (None, None)
+    )
+    
+    try:
+        success, counts = conn_future.result()
+    except Exception as e:
+        success, counts = False, {"error": str(e)}
+    
     # 1. App Info
     print("1. App Information:")
-    sp_id, sp_name = get_app_service_principal(config.DATABRICKS_HOST, token, config.APP_NAME)
     if sp_id:
         print(f"   ✓ App Name: {config.APP_NAME}")
         print(f"   ✓ Service Principal ID: {sp_id}")
@@ -564,7 +1038,6 @@ def action_status(config: Config) -> int:
     print(f"   Instance: {config.LAKEBASE_INSTANCE_NAME}")
     print(f"   Host: {(config.LAKEBASE_HOST or 'NOT SET')[:50]}...")
     
-    success, counts = check_lakebase_connection(config, token)
     if success:
         print("   ✓ Connection successful!")
         for table, count in counts.items():
@@ -576,20 +1049,11 @@ def action_status(config: Config) -> int:
     print("\n" + "=" * 60)
     print("PERMISSION SETUP (if needed)")
     print("=" * 60)
-    print(f"""
-To grant the app access to Lakebase as superuser:
-
-1. Go to: {config.DATABRICKS_HOST.replace('https://', '')}
-2. Navigate to: Compute > Lakebase Postgres > {config.LAKEBASE_INSTANCE_NAME}
-3. Click: Permissions tab
-4. Click: Add role
-5. Enter Service Principal ID: {sp_id}
-6. Set Role membership: databricks_superuser
-7. Click: Confirm
-
-NOTE: Lakebase management APIs are not yet public.
-      Permission setup must be done via UI.
-""")
+    print(_PERMISSION_SETUP_TMPL.substitute(
+        host=config.DATABRICKS_HOST_NETLOC,
+        instance=config.LAKEBASE_INSTANCE_NAME,
+        sp_id=sp_id,
+    ))
     
     return 0 if success else 1
 
@@ -603,7 +1067,9 @@ def action_grant_permissions(config: Config, catalog_name: str) -> int:
         return 1
     
     # Get app service principal
-    sp_id, sp_name = get_app_service_principal(config.DATABRICKS_HOST, token, config.APP_NAME)
+    sp_id, sp_name = get_app_service_principal(
+        config.DATABRICKS_HOST, token, config.APP_NAME, fresh=True
+    )
     
     if not sp_id:
         print(f"❌ Could not get service principal for app: {config.APP_NAME}")
@@ -652,7 +1118,8 @@ def action_full_info(config: Config) -> int:
     if not token:
         return 1
     
-    app_info = get_full_app_info(config.DATABRICKS_HOST, token, config.APP_NAME)
+    # Shows the active deployment, so never report a cached one
+    app_info = get_full_app_info(config.DATABRICKS_HOST, token, config.APP_NAME, fresh=True)
     
     if app_info:
         print(f"App Name:               {app_info.get('name')}")
@@ -686,7 +1153,9 @@ def action_add_lakebase_role(config: Config) -> int:
         return 1
     
     # Get app service principal
-    sp_id, sp_name = get_app_service_principal(config.DATABRICKS_HOST, token, config.APP_NAME)
+    sp_id, sp_name = get_app_service_principal(
+        config.DATABRICKS_HOST, token, config.APP_NAME, fresh=True
+    )
     
     if not sp_id:
         print(f"❌ Could not get service principal for app: {config.APP_NAME}")
@@ -699,10 +1168,10 @@ def action_add_lakebase_role(config: Config) -> int:
     
     # Check if role already exists
     existing_roles = get_lakebase_roles(config.DATABRICKS_HOST, token, config.LAKEBASE_INSTANCE_NAME)
-    for role in existing_roles:
-        if role.get('name') == sp_id:
-            print(f"⚠️  Role already exists: {role.get('membership_role')}")
-            return 0
+    roles_by_name = {role.get('name'): role for role in existing_roles}
+    if sp_id in roles_by_name:
+        print(f"⚠️  Role already exists: {roles_by_name[sp_id].get('membership_role')}")
+        return 0
     
     # Add the role
     print(f"Adding DATABRICKS_SUPERUSER role...")
@@ -757,14 +1226,17 @@ def action_link_app_resource(config: Config) -> int:
     
     # Check if resource already exists
     existing_resources = get_app_resources(config.DATABRICKS_HOST, token, config.APP_NAME)
+    linked_instances = {
+        db.get('instance_name'): db
+        for db in (resource.get('database') or {} for resource in existing_resources)
+    }
     
-    for resource in existing_resources:
-        db = resource.get('database', {})
-        if db.get('instance_name') == config.LAKEBASE_INSTANCE_NAME:
-            print(f"⚠️  Lakebase instance already linked to app")
-            print(f"   Instance: {db.get('instance_name')}")
-            print(f"   Permission: {db.get('permission')}")
-            return 0
+    if config.LAKEBASE_INSTANCE_NAME in linked_instances:
+        db = linked_instances[config.LAKEBASE_INSTANCE_NAME]
+        print(f"⚠️  Lakebase instance already linked to app")
+        print(f"   Instance: {db.get('instance_name')}")
+        print(f"   Permission: {db.get('permission')}")
+        return 0
     
     # Link the Lakebase instance as app resource
     print(f"Linking Lakebase instance with CAN_CONNECT_AND_CREATE permission...")
@@ -783,8 +1255,14 @@ def action_link_app_resource(config: Config) -> int:
 
 
 def action_instructions(config: Config) -> int:
-    """Print setup instructions."""
-    token = get_databricks_token(config.DATABRICKS_HOST)
+    """
+    Print setup instructions.
+    
+    The service principal is filled in only when a token is already cached or
+    DATABRICKS_TOKEN is set; otherwise a placeholder is printed rather than
+    spawning the Databricks CLI just to render docs.
+    """
+    token = get_cached_databricks_token(config.DATABRICKS_HOST) or os.getenv("DATABRICKS_TOKEN")
     sp_id, sp_name = None, None
     
     if token:
@@ -793,82 +1271,12 @@ def action_instructions(config: Config) -> int:
     print("=" * 60)
     print("LAKEBASE SETUP INSTRUCTIONS")
     print("=" * 60)
-    print(f"""
-OPTION A: Using Databricks Asset Bundles (Recommended)
-======================================================
-Lakebase infrastructure can be managed via databricks.yml.
-Reference: https://github.com/databricks/bundle-examples/tree/main/knowledge_base/database_with_catalog
-
-STEP 1: Deploy Infrastructure with DAB
---------------------------------------
-   # Validate the bundle configuration
-   databricks bundle validate
-   
-   # Deploy Lakebase instance + app
-   databricks bundle deploy -t development
-
-This creates:
-   - Lakebase PostgreSQL instance
-   - Catalog and database
-   - Databricks App
-
-STEP 2: Get App Service Principal
----------------------------------
-After deployment, get the service principal:
-   python scripts/lakebase_manager.py --action app-info
-
-STEP 3: Add App Permission to Lakebase (Manual Step)
-----------------------------------------------------
-1. Navigate to: Compute > Lakebase Postgres > {config.LAKEBASE_INSTANCE_NAME}
-2. Click: Permissions tab
-3. Click: Add role
-4. Enter Service Principal ID: {sp_id or '<from Step 2>'}
-5. Set Role membership: databricks_superuser
-6. Click: Confirm
-
-STEP 4: Update app.yaml with Connection Details
------------------------------------------------
-Get connection details from:
-   Compute > Lakebase Postgres > {config.LAKEBASE_INSTANCE_NAME} > Connection details
-
-Update app.yaml env vars:
-   LAKEBASE_HOST: <endpoint from connection details>
-   LAKEBASE_DATABASE: databricks_postgres
-
-STEP 5: Create Tables and Seed Data
------------------------------------
-   ./scripts/setup-lakebase.sh --recreate
-
-STEP 6: Redeploy App
---------------------
-   databricks bundle deploy -t development
-
-
-OPTION B: Manual Setup (Alternative)
-====================================
-
-STEP 1: Create Lakebase Instance via UI
----------------------------------------
-1. Go to: {config.DATABRICKS_HOST}
-2. Navigate to: Compute > Lakebase Postgres
-3. Click: Create
-4. Enter name: {config.LAKEBASE_INSTANCE_NAME}
-5. Click: Create
-
-STEP 2: Deploy App
-------------------
-   databricks apps deploy {config.APP_NAME} --source-code-path /Workspace/...
-
-STEP 3: Add Permission (same as Option A Step 3)
-
-STEP 4: Update app.yaml (same as Option A Step 4)
-
-STEP 5: Create Tables
----------------------
-   ./scripts/setup-lakebase.sh --recreate
-
-Your app should now have full access to Lakebase!
-""")
+    print(_INSTRUCTIONS_TMPL.substitute(
+        host=config.DATABRICKS_HOST,
+        instance=config.LAKEBASE_INSTANCE_NAME,
+        app_name=config.APP_NAME,
+        sp_id=sp_id or '<from Step 2>',
+    ))
     
     return 0
 
@@ -877,6 +1285,21 @@ Your app should now have full access to Lakebase!
 # CLI
 # =============================================================================
 
+# action name -> (handler, argparse dests passed to it and required by it)
+ACTIONS = {
+    "check": (action_check, []),
+    "app-info": (action_app_info, []),
+    "full-info": (action_full_info, []),
+    "status": (action_status, []),
+    "instructions": (action_instructions, []),
+    "grant-permissions": (action_grant_permissions, ["catalog"]),
+    "deploy": (action_deploy, ["source_path"]),
+    "add-lakebase-role": (action_add_lakebase_role, []),
+    "list-lakebase-roles": (action_list_lakebase_roles, []),
+    "link-app-resource": (action_link_app_resource, []),
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Lakebase Instance Manager for Databricks Apps",
@@ -920,9 +1343,7 @@ NOTE: Lakebase management APIs are not yet publicly available.
     
     parser.add_argument(
         "--action",
-        choices=["check", "app-info", "full-info", "status", "instructions", 
-                 "grant-permissions", "deploy", "add-lakebase-role", "list-lakebase-roles",
-                 "link-app-resource"],
+        choices=list(ACTIONS),
         required=True,
         help="Action to perform"
     )
@@ -965,6 +1386,11 @@ NOTE: Lakebase management APIs are not yet publicly available.
     
     args = parser.parse_args()
     
+    # Actions print many short lines; on a terminal stdout is line-buffered,
+    # so batch them into block writes that are flushed at exit
+    if sys.stdout.isatty() and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     # Update config from args
     Config.DATABRICKS_HOST = args.host
     Config.LAKEBASE_INSTANCE_NAME = args.instance_name
@@ -973,44 +1399,13 @@ NOTE: Lakebase management APIs are not yet publicly available.
     # Load from app.yaml
     Config.load_from_app_yaml(args.project_root)
     
-    # Check for required packages
-    try:
-        import psycopg2
-        import requests
-    except ImportError as e:
-        print(f"❌ Missing required package: {e}")
-        print("   Install with: pip install psycopg2-binary requests")
-        return 1
-    
     # Execute action
-    if args.action == "check":
-        return action_check(Config)
-    elif args.action == "app-info":
-        return action_app_info(Config)
-    elif args.action == "full-info":
-        return action_full_info(Config)
-    elif args.action == "status":
-        return action_status(Config)
-    elif args.action == "instructions":
-        return action_instructions(Config)
-    elif args.action == "grant-permissions":
-        if not args.catalog:
-            print("❌ --catalog is required for grant-permissions action")
-            return 1
-        return action_grant_permissions(Config, args.catalog)
-    elif args.action == "deploy":
-        if not args.source_path:
-            print("❌ --source-path is required for deploy action")
+    handler, required = ACTIONS[args.action]
+    for dest in required:
+        if not getattr(args, dest):
+            print(f"❌ --{dest.replace('_', '-')} is required for {args.action} action")
             return 1
-        return action_deploy(Config, args.source_path)
-    elif args.action == "add-lakebase-role":
-        return action_add_lakebase_role(Config)
-    elif args.action == "list-lakebase-roles":
-        return action_list_lakebase_roles(Config)
-    elif args.action == "link-app-resource":
-        return action_link_app_resource(Config)
-    
-    return 1
+    return handler(Config, *(getattr(args, dest) for dest in required))
 
 
 if __name__ == "__main__":
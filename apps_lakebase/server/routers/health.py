@@ -9,8 +9,9 @@ Reference: https://github.com/databricks-solutions/claude-databricks-app-templat
 """
 
 import os
+import time
 import logging
-from datetime import datetime
+import importlib.util
 from typing import Optional
 
 from fastapi import APIRouter
@@ -20,6 +21,33 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _package_status(name: str) -> str:
+    """Report whether a package is importable without importing it."""
+    try:
+        return "ok" if importlib.util.find_spec(name) is not None else "not_installed"
+    except ModuleNotFoundError:
+        # Raised when a parent package (e.g. "databricks") is missing
+        return "not_installed"
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string with microseconds and a Z suffix."""
+    t = time.time()
+    st = time.gmtime(t)
+    return (
+        f"{st.tm_year:04d}-{st.tm_mon:02d}-{st.tm_mday:02d}"
+        f"T{st.tm_hour:02d}:{st.tm_min:02d}:{st.tm_sec:02d}.{int((t % 1) * 1e6):06d}Z"
+    )
+
+
+# Installed packages don't change while the app runs, so probe them once
+PACKAGE_CHECKS = {
+    "databricks_sdk": _package_status("databricks.sdk"),
+    "mlflow": _package_status("mlflow"),
+    "pandas": _package_status("pandas"),
+}
+
+
 class HealthStatus(BaseModel):
     """Health check response model."""
     status: str
@@ -60,7 +88,7 @@ async def health_check() -> HealthStatus:
         service="databricks-app",
         version="0.1.0",
         environment=os.getenv("ENVIRONMENT", "development"),
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=_iso_now(),
     )
 
 
@@ -77,39 +105,26 @@ async def readiness_check() -> ReadinessStatus:
     """
     checks = {
         "app": "ok",
+        # Databricks SDK, MLflow and pandas availability
+        **PACKAGE_CHECKS,
     }
     
-    # Check Databricks SDK availability
-    try:
-        import databricks.sdk
-        checks["databricks_sdk"] = "ok"
-    except ImportError:
-        checks["databricks_sdk"] = "not_installed"
-    
-    # Check MLflow availability
-    try:
-        import mlflow
-        checks["mlflow"] = "ok"
-    except ImportError:
-        checks["mlflow"] = "not_installed"
-    
-    # Check pandas availability
-    try:
-        import pandas
-        checks["pandas"] = "ok"
-    except ImportError:
-        checks["pandas"] = "not_installed"
-    
     # Determine overall readiness
     all_ok = all(v == "ok" for v in checks.values() if v != "not_installed")
     
     return ReadinessStatus(
         ready=all_ok,
         checks=checks,
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=_iso_now(),
     )
 
 
+# Successful Databricks connection checks are reused for this many seconds
+DATABRICKS_STATUS_TTL_SECONDS = 300
+
+_WS_CACHE = {"client": None, "status": None, "expires": 0.0}
+
+
 @router.get("/health/databricks", response_model=DatabricksStatus)
 async def databricks_connection_check() -> DatabricksStatus:
     """
@@ -118,20 +133,32 @@ async def databricks_connection_check() -> DatabricksStatus:
     Verifies that the application can connect to the Databricks workspace
     using the configured credentials.
     
+    A successful result is cached for DATABRICKS_STATUS_TTL_SECONDS so
+    frequent probes don't rebuild the client and call the API each time.
+    
     Returns:
         DatabricksStatus: Connection status and workspace details
     """
+    if _WS_CACHE["status"] is not None and time.monotonic() < _WS_CACHE["expires"]:
+        return _WS_CACHE["status"]
+    
     try:
         from databricks.sdk import WorkspaceClient
         
-        w = WorkspaceClient()
+        w = _WS_CACHE["client"]
+        if w is None:
+            w = WorkspaceClient()
+            _WS_CACHE["client"] = w
         current_user = w.current_user.me()
         
-        return DatabricksStatus(
+        status = DatabricksStatus(
             connected=True,
             workspace=w.config.host,
             user=current_user.user_name if current_user else None,
         )
+        _WS_CACHE["status"] = status
+        _WS_CACHE["expires"] = time.monotonic() + DATABRICKS_STATUS_TTL_SECONDS
+        return status
     except ImportError:
         return DatabricksStatus(
             connected=False,
@@ -139,6 +166,8 @@ async def databricks_connection_check() -> DatabricksStatus:
         )
     except Exception as e:
         logger.warning(f"Databricks connection check failed: {e}")
+        # Rebuild the client on the next probe in case its config went bad
+        _WS_CACHE["client"] = None
         return DatabricksStatus(
             connected=False,
             error=str(e),
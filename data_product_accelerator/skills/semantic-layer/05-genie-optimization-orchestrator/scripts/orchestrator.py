@@ -23,24 +23,63 @@ Requirements:
     - mlflow[databricks]>=3.4.0
     - pyyaml
     - gepa>=0.1.0 (Tier 1 only)
+    - orjson (optional; faster JSON artifact read/write)
 """
 
+import os
 import re
 import time
 import json
+import threading
 import yaml
 import hashlib
 import argparse
-from datetime import datetime
+import atexit
+import copy
+import functools
+import operator
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 
+# libyaml-backed loader/dumper when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _safe_load(stream):
+    """yaml.safe_load, using the C loader when available."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    """Integer setting from the environment, clamped to ``minimum``.
+
+    A malformed value falls back to ``default`` with a warning rather than
+    failing the module import.
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        print(f"WARNING: {name}={raw!r} is not an integer; using {default}.")
+        return default
+    return max(value, minimum)
+
+
+@functools.cache
 def _resolve_cli_profile() -> str | None:
     """Read databricks.yml to resolve workspace profile for WorkspaceClient."""
     for candidate in ["databricks.yml", "../databricks.yml", "../../databricks.yml"]:
         p = Path(candidate)
         if p.exists():
             try:
-                cfg = yaml.safe_load(p.read_text())
+                cfg = _safe_load(p.read_bytes())
                 profile = (cfg.get("workspace") or {}).get("profile")
                 if profile:
                     print(f"  CLI profile resolved from {candidate}: {profile}")
@@ -65,6 +104,11 @@ try:
 except ImportError:
     mlflow = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Worker script imports (Optimizer + Applier)
 # ---------------------------------------------------------------------------
@@ -148,12 +192,9 @@ def _import_applier():
     return apply_proposal_batch, strip_non_exportable_fields, verify_repo_update
 
 
-def _default_experiment_path(domain: str) -> str:
-    """Build a /Users/<email>/genie-optimization/<domain> experiment path.
-
-    Hard constraint #7: bare paths like /genie-optimization/... cause
-    RESOURCE_DOES_NOT_EXIST. Must be under /Users/<email>/.
-    """
+@functools.cache
+def _current_user_email() -> str:
+    """Resolve the caller's email once per process (env first, then the SDK)."""
     import os
     email = os.environ.get("DATABRICKS_USER_EMAIL", "")
     if not email and w is not None:
@@ -162,8 +203,16 @@ def _default_experiment_path(domain: str) -> str:
             email = me.user_name or ""
         except Exception:
             pass
-    if not email:
-        email = "unknown_user"
+    return email
+
+
+def _default_experiment_path(domain: str) -> str:
+    """Build a /Users/<email>/genie-optimization/<domain> experiment path.
+
+    Hard constraint #7: bare paths like /genie-optimization/... cause
+    RESOURCE_DOES_NOT_EXIST. Must be under /Users/<email>/.
+    """
+    email = _current_user_email() or "unknown_user"
     path = f"/Users/{email}/genie-optimization/{domain}"
     return path
 
@@ -215,10 +264,10 @@ def _split_uc_schema(uc_schema: str | None) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
-def _run_sql_statement_rows(warehouse_id: str, statement: str) -> list[dict]:
-    """Execute SQL Statement API query and return rows as dicts (best effort)."""
+def _run_sql_statement(warehouse_id: str, statement: str) -> tuple[list[str], list[list]]:
+    """Execute SQL Statement API query and return (column_names, raw rows) (best effort)."""
     if w is None or not warehouse_id:
-        return []
+        return [], []
     try:
         resp = w.api_client.do(
             "POST",
@@ -233,48 +282,175 @@ def _run_sql_statement_rows(warehouse_id: str, statement: str) -> list[dict]:
         )
         statement_id = resp.get("statement_id")
         status = (resp.get("status") or {}).get("state", "")
+        # Poll quickly at first so short queries return promptly, backing off
+        # to 2s; give up after the same ~60s budget as before.
         polls = 0
-        while statement_id and status in ("PENDING", "RUNNING") and polls < 30:
-            time.sleep(2)
+        deadline = time.monotonic() + 60
+        while (statement_id and status in ("PENDING", "RUNNING")
+               and time.monotonic() < deadline):
+            time.sleep(min(2.0, 0.25 * 2 ** polls))
             resp = w.api_client.do("GET", f"/api/2.0/sql/statements/{statement_id}")
             status = (resp.get("status") or {}).get("state", "")
             polls += 1
 
         if status != "SUCCEEDED":
-            return []
+            return [], []
 
         manifest = resp.get("manifest", {}) or {}
         result = resp.get("result", {}) or {}
         columns = (((manifest.get("schema") or {}).get("columns")) or [])
-        data_rows = result.get("data_array", []) or []
         if not columns:
-            return []
+            return [], []
         col_names = [c.get("name", f"c{i}") for i, c in enumerate(columns)]
-        return [dict(zip(col_names, row)) for row in data_rows]
+        data_rows = result.get("data_array", []) or []
+        # Large results arrive in chunks; fetch the rest one chunk at a time
+        next_chunk = result.get("next_chunk_index")
+        while statement_id and next_chunk is not None:
+            chunk = w.api_client.do(
+                "GET",
+                f"/api/2.0/sql/statements/{statement_id}/result/chunks/{next_chunk}",
+            ) or {}
+            data_rows.extend(chunk.get("data_array", []) or [])
+            next_chunk = chunk.get("next_chunk_index")
+        return col_names, data_rows
     except Exception:
-        return []
+        return [], []
+
+
+def _run_sql_statement_rows(warehouse_id: str, statement: str) -> list[dict]:
+    """Execute SQL Statement API query and return rows as dicts (best effort)."""
+    col_names, data_rows = _run_sql_statement(warehouse_id, statement)
+    return [dict(zip(col_names, row)) for row in data_rows]
+
+
+# Output columns per information_schema source, in artifact order
+_UC_METADATA_FIELDS = {
+    "column": ("table_name", "column_name", "data_type", "comment"),
+    "tag": ("catalog_name", "schema_name", "table_name", "tag_name", "tag_value"),
+    "routine": ("routine_name", "routine_type", "routine_definition",
+                "return_type", "routine_schema"),
+}
+
+
+def _fetch_uc_metadata(warehouse_id: str, uc_catalog: str, uc_db: str) -> tuple[list, list, list]:
+    """Fetch columns, table tags and routines for a schema in one statement.
+
+    The three information_schema queries are combined with UNION ALL and a
+    ``kind`` discriminator (each branch NULL-pads the others' columns), then
+    split back into per-source row dicts client-side. If the combined
+    statement fails (e.g. table_tags is unavailable for the catalog), each
+    source is queried on its own so the others still load.
+    """
+    sources = {
+        "column": f"{uc_catalog}.information_schema.columns WHERE table_schema = '{uc_db}'",
+        "tag": f"{uc_catalog}.information_schema.table_tags WHERE schema_name = '{uc_db}'",
+        "routine": f"{uc_catalog}.INFORMATION_SCHEMA.ROUTINES WHERE routine_schema = '{uc_db}'",
+    }
+    all_fields = list(dict.fromkeys(
+        f for fields in _UC_METADATA_FIELDS.values() for f in fields
+    ))
+    branches = []
+    for kind, source in sources.items():
+        own = _UC_METADATA_FIELDS[kind]
+        select_list = ", ".join(
+            f"CAST({'data_type' if kind == 'routine' and f == 'return_type' else f} AS STRING) AS {f}"
+            if f in own else f"CAST(NULL AS STRING) AS {f}"
+            for f in all_fields
+        )
+        branches.append(f"SELECT '{kind}' AS kind, {select_list} FROM {source}")
+
+    col_names, data_rows = _run_sql_statement(warehouse_id, "\nUNION ALL\n".join(branches))
+    if col_names:
+        results = [(col_names, data_rows)]
+    else:
+        # _run_sql_statement returns no columns only on failure; a succeeded
+        # query with no matching rows still carries its schema
+        results = [_run_sql_statement(warehouse_id, branch) for branch in branches]
+
+    buckets = {kind: [] for kind in _UC_METADATA_FIELDS}
+    for col_names, data_rows in results:
+        if not data_rows:
+            continue
+        # Index raw rows by position so each row becomes exactly one output dict
+        pos = {name: i for i, name in enumerate(col_names)}
+        kind_pos = pos["kind"]
+        positions = {
+            kind: [pos[f] for f in fields] for kind, fields in _UC_METADATA_FIELDS.items()
+        }
+        for row in data_rows:
+            kind = row[kind_pos]
+            if kind in buckets:
+                buckets[kind].append(
+                    dict(zip(_UC_METADATA_FIELDS[kind], [row[i] for i in positions[kind]]))
+                )
+    return buckets["column"], buckets["tag"], buckets["routine"]
 
 
 # =========================================================================
 # Space Discovery
 # =========================================================================
 
-def discover_spaces() -> list:
-    """List available Genie Spaces via SDK."""
+def discover_spaces() -> Iterator[dict]:
+    """Yield available Genie Spaces via SDK as each page arrives."""
     if w is None:
         print("ERROR: SDK not initialized.")
-        return []
-    spaces = list(w.genie.list_spaces())
-    return [{"id": s.space_id, "title": s.title} for s in spaces]
+        return
+    for s in w.genie.list_spaces():
+        yield {"id": s.space_id, "title": s.title}
 
 
 # =========================================================================
 # LoggedModel Version Tracking
 # =========================================================================
 
+def _write_json_file(path: str, data) -> None:
+    """Write ``data`` as indented JSON, via orjson when it is installed."""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                data, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the stdlib handle it
+            pass
+        else:
+            with open(path, "wb") as f:
+                f.write(payload)
+            return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def _dumps_json(data) -> bytes:
+    """Compact JSON as UTF-8 bytes, via orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return json.dumps(data).encode()
+
+
+def _loads_json(raw: str | bytes):
+    """json.loads, via orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity written by json.dump, which orjson rejects
+            pass
+    return json.loads(raw)
+
+
+def _read_json_file(path: str):
+    """Read a JSON file, via orjson when it is installed."""
+    with open(path, "rb") as f:
+        return _loads_json(f.read())
+
+
 def _build_patch_summary(patch_set: list, iteration: int) -> dict:
     """Build a structured summary of patches for quick cross-model comparison."""
-    from collections import Counter
     by_type = Counter()
     by_lever = Counter()
     by_risk = Counter()
@@ -308,6 +484,58 @@ def _build_patch_summary(patch_set: list, iteration: int) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=32)
+def _model_source_run_id(model_id: str) -> str | None:
+    """Creation run of a LoggedModel (fixed once the model exists)."""
+    return mlflow.get_logged_model(model_id=model_id).source_run_id
+
+
+# model_id -> model_state/ directory downloaded by this process. Each lives
+# in its own mkdtemp (owner-only) and is removed when the process exits.
+_MODEL_STATE_DIRS: dict[str, str] = {}
+
+
+def _cleanup_model_state_dirs():
+    import shutil as _sh
+
+    for state_dir in _MODEL_STATE_DIRS.values():
+        _sh.rmtree(os.path.dirname(state_dir), ignore_errors=True)
+    _MODEL_STATE_DIRS.clear()
+
+
+atexit.register(_cleanup_model_state_dirs)
+
+
+def _download_model_state(model_id: str) -> str | None:
+    """Local copy of a LoggedModel's model_state/ artifacts, downloaded once.
+
+    A model's creation-run artifacts never change, so the download is kept
+    for the rest of the session and reused by later parent diffs and
+    rollbacks instead of being fetched again each iteration.
+    """
+    import shutil as _sh
+    import tempfile as _tf
+
+    state_dir = _MODEL_STATE_DIRS.get(model_id)
+    if state_dir and os.path.isdir(state_dir):
+        return state_dir
+
+    source_run_id = _model_source_run_id(model_id)
+    if not source_run_id:
+        return None
+    download_dir = _tf.mkdtemp(prefix="genie_model_state_")
+    try:
+        mlflow.artifacts.download_artifacts(
+            run_id=source_run_id, artifact_path="model_state", dst_path=download_dir,
+        )
+    except Exception:
+        _sh.rmtree(download_dir, ignore_errors=True)
+        raise
+    state_dir = os.path.join(download_dir, "model_state")
+    _MODEL_STATE_DIRS[model_id] = state_dir
+    return state_dir
+
+
 def _compute_uc_metadata_diff(
     parent_model_id: str | None,
     current_columns: list,
@@ -323,49 +551,64 @@ def _compute_uc_metadata_diff(
     if not parent_model_id or parent_model_id == "none":
         return None
     try:
-        parent = mlflow.get_logged_model(model_id=parent_model_id)
-        if not parent.source_run_id:
-            return None
-        import tempfile as _tf
-        artifact_dir = mlflow.artifacts.download_artifacts(
-            run_id=parent.source_run_id,
-            artifact_path="model_state",
-            dst_path=_tf.mkdtemp(prefix="parent_model_state_"),
-        )
+        artifact_dir = _download_model_state(parent_model_id)
     except Exception:
         return None
+    if not artifact_dir:
+        return None
 
     import os as _os
 
     def _load_json(fname):
         fpath = _os.path.join(artifact_dir, fname)
         if _os.path.exists(fpath):
-            with open(fpath) as f:
-                return json.load(f)
+            return _read_json_file(fpath)
         return []
 
     prev_columns = _load_json("uc_columns.json")
     prev_tags = _load_json("uc_tags.json")
     prev_routines = _load_json("uc_routines.json")
 
-    import shutil as _sh
-    _sh.rmtree(artifact_dir, ignore_errors=True)
-
     def _diff_rows(prev, curr, key_fields, compare_fields=None):
-        def _row_key(row):
-            return tuple(str(row.get(k, "")) for k in key_fields)
-        prev_map = {_row_key(r): r for r in prev}
-        curr_map = {_row_key(r): r for r in curr}
-        prev_keys = set(prev_map.keys())
-        curr_keys = set(curr_map.keys())
-        added = [curr_map[k] for k in sorted(curr_keys - prev_keys)]
-        removed = [prev_map[k] for k in sorted(prev_keys - curr_keys)]
+        # information_schema values are already strings (or null), so keys
+        # use them as-is for lookups. Output is ordered by the keys' string
+        # form: information_schema queries have no ORDER BY, so row order
+        # can change between runs.
+        if len(key_fields) == 1:
+            _key_field = key_fields[0]
+            def _row_key(row):
+                return (row[_key_field],)
+        else:
+            _row_key = operator.itemgetter(*key_fields)
+
+        def _build_map(rows):
+            try:
+                return {_row_key(r): r for r in rows}
+            except KeyError:
+                # Hand-edited or legacy artifact rows may omit a key field
+                return {tuple(r.get(k, "") for k in key_fields): r for r in rows}
+
+        def _sorted_items(row_map):
+            return sorted(row_map.items(), key=lambda kv: tuple(str(x) for x in kv[0]))
+
+        prev_map = _build_map(prev)
+        curr_map = _build_map(curr)
+        prev_items = _sorted_items(prev_map)
+        added = [r for k, r in _sorted_items(curr_map) if k not in prev_map]
+        removed = [r for k, r in prev_items if k not in curr_map]
         modified = []
         if compare_fields:
-            for k in sorted(prev_keys & curr_keys):
+            for k, prev_row in prev_items:
+                curr_row = curr_map.get(k)
+                if curr_row is None:
+                    continue
+                # Most rows are unchanged between iterations; equal raw values
+                # imply equal strings, so skip those without formatting
+                if all(prev_row.get(f, "") == curr_row.get(f, "") for f in compare_fields):
+                    continue
                 for field in compare_fields:
-                    old_val = str(prev_map[k].get(field, ""))
-                    new_val = str(curr_map[k].get(field, ""))
+                    old_val = str(prev_row.get(field, ""))
+                    new_val = str(curr_row.get(field, ""))
                     if old_val != new_val:
                         modified.append({
                             "key": ".".join(str(x) for x in k),
@@ -455,43 +698,23 @@ def create_genie_model_version(space_id: str, config: dict,
     warehouse_id = config.get("warehouse_id", "")
     uc_catalog, uc_db = _split_uc_schema(uc_schema)
     if uc_catalog and uc_db and warehouse_id:
-        uc_columns = _run_sql_statement_rows(
-            warehouse_id,
-            (
-                f"SELECT table_name, column_name, data_type, comment "
-                f"FROM {uc_catalog}.information_schema.columns "
-                f"WHERE table_schema = '{uc_db}'"
-            ),
-        )
-        uc_tags = _run_sql_statement_rows(
-            warehouse_id,
-            (
-                f"SELECT * FROM {uc_catalog}.information_schema.table_tags "
-                f"WHERE schema_name = '{uc_db}'"
-            ),
-        )
-        uc_routines = _run_sql_statement_rows(
-            warehouse_id,
-            (
-                f"SELECT routine_name, routine_type, routine_definition, "
-                f"data_type AS return_type, routine_schema "
-                f"FROM {uc_catalog}.INFORMATION_SCHEMA.ROUTINES "
-                f"WHERE routine_schema = '{uc_db}'"
-            ),
+        uc_columns, uc_tags, uc_routines = _fetch_uc_metadata(
+            warehouse_id, uc_catalog, uc_db,
         )
 
-    config_hash = hashlib.sha256(
-        json.dumps(
-            {
-                "genie_config": config,
-                "uc_columns": uc_columns,
-                "uc_tags": uc_tags,
-                "uc_routines": uc_routines,
-            },
-            sort_keys=True,
-            default=str,
-        ).encode()
-    ).hexdigest()[:12]
+    # Hash each component separately instead of serializing one combined
+    # document; the hash is only an identifier, so a 6-byte BLAKE2b suffices.
+    # Always json (not orjson) so the hash doesn't depend on what's installed.
+    hasher = hashlib.blake2b(digest_size=6)
+    for part_name, part in (
+        ("genie_config", config),
+        ("uc_columns", uc_columns),
+        ("uc_tags", uc_tags),
+        ("uc_routines", uc_routines),
+    ):
+        hasher.update(part_name.encode())
+        hasher.update(json.dumps(part, sort_keys=True, default=str).encode())
+    config_hash = hasher.hexdigest()
     model_name = f"genie-{domain}-iter{iteration}-{config_hash}"
 
     instructions = config.get("general_instructions", "")
@@ -567,11 +790,11 @@ def create_genie_model_version(space_id: str, config: dict,
             model_type="genie-space",
         )
 
-        state_dir = _os.path.join(
-            tempfile.gettempdir(),
-            f"model_state_iter{iteration}_{config_hash}",
-        )
-        _os.makedirs(state_dir, exist_ok=True)
+        # Stage each artifact folder locally and upload it with one
+        # log_artifacts() call, which lets MLflow batch the file uploads
+        state_dir = tempfile.mkdtemp(prefix=f"model_state_iter{iteration}_{config_hash}_")
+        model_state_dir = _os.path.join(state_dir, "model_state")
+        _os.makedirs(model_state_dir)
 
         for fname, data in [
             ("genie_config.json", config),
@@ -579,39 +802,33 @@ def create_genie_model_version(space_id: str, config: dict,
             ("uc_tags.json", uc_tags),
             ("uc_routines.json", uc_routines),
         ]:
-            fpath = _os.path.join(state_dir, fname)
-            with open(fpath, "w") as sf:
-                json.dump(data, sf, indent=2, default=str)
-            mlflow.log_artifact(fpath, artifact_path="model_state")
+            _write_json_file(_os.path.join(model_state_dir, fname), data)
 
         if uc_diff:
-            diff_path = _os.path.join(state_dir, "uc_metadata_diff.json")
-            with open(diff_path, "w") as df:
-                json.dump(uc_diff, df, indent=2, default=str)
-            mlflow.log_artifact(diff_path, artifact_path="model_state")
+            _write_json_file(_os.path.join(model_state_dir, "uc_metadata_diff.json"), uc_diff)
+        mlflow.log_artifacts(model_state_dir, artifact_path="model_state")
 
         if patch_set:
-            patch_path = _os.path.join(state_dir, "patch_set.json")
-            with open(patch_path, "w") as f:
-                json.dump(patch_set, f, indent=2, default=str)
-            mlflow.log_artifact(patch_path, artifact_path="patches")
-
-            summary_path = _os.path.join(state_dir, "patch_summary.json")
-            with open(summary_path, "w") as f:
-                json.dump(patch_summary, f, indent=2, default=str)
-            mlflow.log_artifact(summary_path, artifact_path="patches")
+            patches_dir = _os.path.join(state_dir, "patches")
+            _os.makedirs(patches_dir)
+            _write_json_file(_os.path.join(patches_dir, "patch_set.json"), patch_set)
+            _write_json_file(_os.path.join(patches_dir, "patch_summary.json"), patch_summary)
+            mlflow.log_artifacts(patches_dir, artifact_path="patches")
 
         import shutil as _shutil
         _shutil.rmtree(state_dir, ignore_errors=True)
 
-        mlflow.log_metric("uc_columns_count", len(uc_columns))
-        mlflow.log_metric("uc_tags_count", len(uc_tags))
-        mlflow.log_metric("uc_routines_count", len(uc_routines))
-        mlflow.log_metric("data_asset_count", len(data_assets))
+        run_metrics = {
+            "uc_columns_count": len(uc_columns),
+            "uc_tags_count": len(uc_tags),
+            "uc_routines_count": len(uc_routines),
+            "data_asset_count": len(data_assets),
+        }
         if uc_diff:
-            mlflow.log_metric("uc_columns_changed", uc_diff["summary"]["columns_changed"])
-            mlflow.log_metric("uc_tags_changed", uc_diff["summary"]["tags_changed"])
-            mlflow.log_metric("uc_routines_changed", uc_diff["summary"]["routines_changed"])
+            run_metrics["uc_columns_changed"] = uc_diff["summary"]["columns_changed"]
+            run_metrics["uc_tags_changed"] = uc_diff["summary"]["tags_changed"]
+            run_metrics["uc_routines_changed"] = uc_diff["summary"]["routines_changed"]
+        mlflow.log_metrics(run_metrics)
 
     mlflow.set_active_model(model_id=logged_model.model_id)
 
@@ -671,16 +888,15 @@ def rollback_to_model(model_id: str, space_id: str):
     via source_run_id. Used when P0 gate fails and the orchestrator needs
     to revert to the previous iteration's configuration.
     """
+    _invalidate_space_config(space_id)
     try:
-        model = mlflow.get_logged_model(model_id=model_id)
-        if not model.source_run_id:
+        source_run_id = _model_source_run_id(model_id)
+        if not source_run_id:
             print(f"  WARNING: LoggedModel {model_id} has no source_run_id — "
                   "cannot download artifacts for rollback.")
             return None
 
-        artifact_dir = mlflow.artifacts.download_artifacts(
-            run_id=model.source_run_id, artifact_path="model_state"
-        )
+        artifact_dir = _download_model_state(model_id)
         import os as _os
         config_path = _os.path.join(artifact_dir, "genie_config.json")
         if not _os.path.exists(config_path):
@@ -692,11 +908,10 @@ def rollback_to_model(model_id: str, space_id: str):
                 print(f"  WARNING: No genie_config.json in {artifact_dir}")
                 return None
 
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _read_json_file(config_path)
 
         print(f"  Rollback config loaded from LoggedModel {model_id}")
-        print(f"    source_run: {model.source_run_id}")
+        print(f"    source_run: {source_run_id}")
         return config
     except Exception as e:
         print(f"  WARNING: Rollback from LoggedModel failed: {e}")
@@ -720,8 +935,10 @@ def _check_temporal_freshness(benchmarks: list) -> list:
     for b in benchmarks:
         question = b.get("question", "")
         expected_sql = b.get("expected_sql", "") or b.get("sql", "")
-        if _TEMPORAL_PHRASES.search(question) and _HARDCODED_DATE.search(expected_sql):
-            dates_found = _HARDCODED_DATE.findall(expected_sql)
+        # One pass over the SQL; most benchmarks have no literal dates, so
+        # the question is only scanned when there is something to flag.
+        dates_found = _HARDCODED_DATE.findall(expected_sql)
+        if dates_found and _TEMPORAL_PHRASES.search(question):
             qid = b.get("question_id", b.get("id", "unknown"))
             print(
                 f"  WARNING: {qid} has temporal phrasing but hardcoded dates "
@@ -737,15 +954,58 @@ def _check_temporal_freshness(benchmarks: list) -> list:
     return stale
 
 
-def _fetch_space_config(space_id: str) -> dict:
-    """GET Genie Space config with full serialized_space content."""
+# Space configs fetched within this window are reused; every code path that
+# changes a space (apply, rollback, deploy) invalidates its entry first
+SPACE_CONFIG_TTL_SECONDS = 30
+# Within one optimization iteration the space only changes through those
+# paths, so the lever loop reuses the cached config regardless of age
+_ITERATION_SCOPED = float("inf")
+
+_SPACE_CONFIG_CACHE: dict[str, tuple[float, dict]] = {}
+
+
+def _invalidate_space_config(space_id: str | None = None):
+    """Drop the cached config for ``space_id`` (or every space)."""
+    if space_id is None:
+        _SPACE_CONFIG_CACHE.clear()
+    else:
+        _SPACE_CONFIG_CACHE.pop(space_id, None)
+
+
+# Time for applied metadata/instruction changes to reach Genie's serving
+# path before the next evaluation; the space API exposes no readiness signal
+PROPAGATION_WAIT_SECONDS = _env_int("GENIE_PROPAGATION_WAIT_SECONDS", 30)
+
+
+def _wait_for_propagation(space_id: str):
+    """Drop the cached space config and wait PROPAGATION_WAIT_SECONDS."""
+    _invalidate_space_config(space_id)
+    if PROPAGATION_WAIT_SECONDS > 0:
+        print(f"  Waiting {PROPAGATION_WAIT_SECONDS}s for propagation...")
+        time.sleep(PROPAGATION_WAIT_SECONDS)
+
+
+def _fetch_space_config(space_id: str, max_age: float | None = None) -> dict:
+    """GET Genie Space config with full serialized_space content.
+
+    Returns a copy of a config fetched in the last ``max_age`` seconds
+    (default SPACE_CONFIG_TTL_SECONDS) when one is cached, so callers may
+    mutate the result freely. Pass ``max_age=float("inf")`` where the space
+    can only have changed through paths that invalidate the cache.
+    """
     if w is None:
         return {}
+    if max_age is None:
+        max_age = SPACE_CONFIG_TTL_SECONDS
+    cached = _SPACE_CONFIG_CACHE.get(space_id)
+    if cached and time.monotonic() - cached[0] < max_age:
+        return copy.deepcopy(cached[1])
     config = w.api_client.do(
         "GET",
         f"/api/2.0/genie/spaces/{space_id}",
         query={"include_serialized_space": "true"},
     )
+    _SPACE_CONFIG_CACHE[space_id] = (time.monotonic(), copy.deepcopy(config))
     data_assets = config.get("data_assets", [])
     tables = sum(1 for a in data_assets if a.get("type") == "TABLE")
     mvs = sum(1 for a in data_assets if a.get("type") == "METRIC_VIEW")
@@ -760,11 +1020,16 @@ def _fetch_space_config(space_id: str) -> dict:
 # Progress Tracking
 # =========================================================================
 
+def _utc_now_iso() -> str:
+    """Current UTC time in ISO 8601 with a Z suffix (session timestamps)."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 def init_progress(space_id: str, domain: str, max_iterations: int = 5) -> dict:
     return {
         "space_id": space_id,
         "domain": domain,
-        "started_at": datetime.utcnow().isoformat() + "Z",
+        "started_at": _utc_now_iso(),
         "current_iteration": 0,
         "max_iterations": max_iterations,
         "status": "in_progress",
@@ -804,8 +1069,7 @@ def load_progress(path: str):
     p = Path(path)
     if not p.exists():
         return None
-    with open(p) as f:
-        return json.load(f)
+    return _read_json_file(p)
 
 
 def update_progress(progress: dict, iteration_result: dict) -> dict:
@@ -819,20 +1083,26 @@ def update_progress(progress: dict, iteration_result: dict) -> dict:
         progress["best_iteration"] = progress["current_iteration"]
     progress["remaining_failures"] = iteration_result.get("remaining_failures", [])
 
+    # Repeatability re-runs re-apply the same patch set and often land on the
+    # same scores; only record an entry when it differs from the previous one
     scores = iteration_result.get("scores", {})
     if scores:
-        progress.setdefault("score_history", []).append({
-            "iteration": progress["current_iteration"],
-            "scores": scores,
-            "overall_accuracy": overall,
-        })
+        score_history = progress.setdefault("score_history", [])
+        if not score_history or score_history[-1].get("scores") != scores:
+            score_history.append({
+                "iteration": progress["current_iteration"],
+                "scores": scores,
+                "overall_accuracy": overall,
+            })
 
     patches = iteration_result.get("patch_set") or iteration_result.get("proposals_applied", [])
     if patches:
-        progress.setdefault("patch_history", []).append({
-            "iteration": progress["current_iteration"],
-            "patches": patches,
-        })
+        patch_history = progress.setdefault("patch_history", [])
+        if not patch_history or patch_history[-1].get("patches") != patches:
+            patch_history.append({
+                "iteration": progress["current_iteration"],
+                "patches": patches,
+            })
 
     rep_pct = iteration_result.get("repeatability_pct", 0)
     if rep_pct:
@@ -844,17 +1114,16 @@ def update_progress(progress: dict, iteration_result: dict) -> dict:
     return progress
 
 
-RISK_LEVEL_SCORE = {"low": 1, "medium": 2, "high": 3}
+RISK_LEVEL_SCORE = MappingProxyType({"low": 1, "medium": 2, "high": 3})
 
 
 def _compute_patch_cost(proposals: list) -> int:
     """Compute weighted cost: sum of risk_level scores (low=1, medium=2, high=3)."""
-    cost = 0
-    for p in proposals:
-        if isinstance(p, dict):
-            risk = p.get("risk_level", "medium")
-            cost += RISK_LEVEL_SCORE.get(risk, 2)
-    return cost if cost > 0 else len(proposals)
+    cost = sum(
+        RISK_LEVEL_SCORE.get(p.get("risk_level"), 2)
+        for p in proposals if isinstance(p, dict)
+    )
+    return cost or len(proposals)
 
 
 def _update_pareto_frontier(progress: dict, iteration_result: dict):
@@ -878,27 +1147,33 @@ def _update_pareto_frontier(progress: dict, iteration_result: dict):
     }
 
     frontier = progress.setdefault("pareto_frontier", [])
-    dominated = []
-    is_dominated = False
-    for i, existing in enumerate(frontier):
-        ex_cost = existing.get("patch_cost", existing.get("patch_count", 0))
-        ex_rep = existing.get("repeatability", 0)
-        if (vector["correctness"] >= existing["correctness"]
-                and vector["repeatability"] >= ex_rep
-                and vector["regressions"] <= existing["regressions"]
-                and vector["patch_cost"] <= ex_cost):
-            dominated.append(i)
-        elif (existing["correctness"] >= vector["correctness"]
-              and ex_rep >= vector["repeatability"]
-              and existing["regressions"] <= vector["regressions"]
-              and ex_cost <= vector["patch_cost"]):
-            is_dominated = True
-            break
-
-    if not is_dominated:
-        for i in sorted(dominated, reverse=True):
-            frontier.pop(i)
-        frontier.append(vector)
+    new_obj = _pareto_objectives(vector)
+    survivors = []
+    for existing in frontier:
+        ex_obj = _pareto_objectives(existing)
+        if all(n <= e for n, e in zip(new_obj, ex_obj)):
+            continue  # new vector dominates (or equals) this point
+        if all(e <= n for n, e in zip(new_obj, ex_obj)):
+            return  # new vector is dominated; frontier unchanged
+        survivors.append(existing)
+
+    survivors.append(vector)
+    frontier[:] = survivors
+
+
+def _pareto_objectives(entry: dict) -> tuple:
+    """Objective tuple for dominance checks, every component lower-is-better.
+
+    Correctness and repeatability are negated so a single elementwise <=
+    comparison decides dominance. Older entries may carry patch_count
+    instead of patch_cost, or no repeatability.
+    """
+    return (
+        -entry["correctness"],
+        -entry.get("repeatability", 0),
+        entry["regressions"],
+        entry.get("patch_cost", entry.get("patch_count", 0)),
+    )
 
 
 def log_lever_impact(
@@ -942,15 +1217,25 @@ def _normalize_scores(scores: dict) -> dict:
     orchestrator's threshold targets are on 0-100 scale. This converts at
     the boundary so all downstream comparisons are like-for-like.
     """
-    if not scores:
+    def _needs_scaling(score):
+        return isinstance(score, (int, float)) and 0 <= score <= 1.0
+
+    # Already on the 0-100 scale (the usual case after the first pass):
+    # hand the dict back rather than copying it
+    if not scores or not any(_needs_scaling(v) for v in scores.values()):
         return scores
-    normalized = {}
-    for judge, score in scores.items():
-        if isinstance(score, (int, float)) and 0 <= score <= 1.0:
-            normalized[judge] = score * 100
-        else:
-            normalized[judge] = score
-    return normalized
+    return {
+        judge: score * 100 if _needs_scaling(score) else score
+        for judge, score in scores.items()
+    }
+
+
+# Read-only: shared by every all_thresholds_met() call that passes no targets
+DEFAULT_JUDGE_TARGETS = MappingProxyType({
+    "syntax_validity": 98, "schema_accuracy": 95, "logical_accuracy": 90,
+    "semantic_equivalence": 90, "completeness": 90, "result_correctness": 85,
+    "asset_routing": 95,
+})
 
 
 def all_thresholds_met(scores: dict, targets: dict | None = None) -> bool:
@@ -959,21 +1244,13 @@ def all_thresholds_met(scores: dict, targets: dict | None = None) -> bool:
     Args:
         scores: Dict of judge_name -> score (0-100 percentage).
                Scores are auto-normalized from 0-1 if needed.
-        targets: Optional override; defaults to standard targets.
+        targets: Optional override; defaults to DEFAULT_JUDGE_TARGETS.
     """
-    scores = _normalize_scores(scores)
-    defaults = {
-        "syntax_validity": 98, "schema_accuracy": 95, "logical_accuracy": 90,
-        "semantic_equivalence": 90, "completeness": 90, "result_correctness": 85,
-        "asset_routing": 95,
-    }
-    targets = targets or defaults
     if not scores:
         return False
-    for judge, target in targets.items():
-        if scores.get(judge, 0) < target:
-            return False
-    return True
+    scores = _normalize_scores(scores)
+    targets = targets or DEFAULT_JUDGE_TARGETS
+    return all(scores.get(judge, 0) >= target for judge, target in targets.items())
 
 
 def add_benchmark_correction(
@@ -990,7 +1267,7 @@ def add_benchmark_correction(
         "old_gt": old_gt,
         "new_gt": new_gt,
         "arbiter_run_id": arbiter_run_id,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": _utc_now_iso(),
     })
     if len(corrections) >= 3:
         print(f"  WARNING: {len(corrections)} arbiter corrections accumulated. "
@@ -1006,22 +1283,39 @@ def verify_dual_persistence(apply_results: list) -> list[str]:
     if isinstance(apply_results, dict):
         # Patch DSL path returns apply_log dict, not per-proposal repo statuses.
         return []
-    missing = []
-    for r in apply_results:
-        if r.get("repo_status") != "success":
-            missing.append(r.get("proposal_id", "unknown"))
-    return missing
+    return [
+        r.get("proposal_id", "unknown")
+        for r in apply_results if r.get("repo_status") != "success"
+    ]
 
 
 def write_progress(progress: dict, path: str):
-    with open(path, "w") as f:
+    """Persist session state atomically.
+
+    The file is written beside ``path`` and renamed over it, so an
+    interrupted write can never leave a truncated progress file that
+    --resume would then fail to load.
+
+    Always the stdlib encoder: orjson would write NaN scores as null (which
+    --resume reads back as None) and default=str would hide values that
+    should fail loudly.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
         json.dump(progress, f, indent=2)
+    os.replace(tmp_path, path)
 
 
 # =========================================================================
 # Inline Evaluation (delegates to Evaluator worker patterns)
 # =========================================================================
 
+# Minimum spacing between Genie questions (API rate limit) and how many
+# question polls may be in flight at once during inline evaluation
+GENIE_QUERY_INTERVAL_SECONDS = 12
+GENIE_EVAL_CONCURRENCY = _env_int("GENIE_EVAL_CONCURRENCY", 4, minimum=1)
+
+
 def run_genie_query(space_id: str, question: str, max_wait: int = 120) -> dict:
     """Execute a query against Genie and return SQL + status."""
     if w is None:
@@ -1090,56 +1384,81 @@ def run_evaluation_iteration(
     print(f"\n--- Iteration {iteration}: Evaluating {len(benchmarks)} questions ---\n")
 
     results = []
+    failed_ids = []
     run_name = (
         f"genie_eval_iter{iteration}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     )
     with mlflow.start_run(run_name=run_name) as run:
-        mlflow.log_param("space_id", space_id)
-        mlflow.log_param("iteration", iteration)
-        mlflow.log_param("benchmark_count", len(benchmarks))
+        mlflow.log_params({
+            "space_id": space_id,
+            "iteration": iteration,
+            "benchmark_count": len(benchmarks),
+        })
         print(f"  MLflow Run: {run.info.run_id} ({run_name})")
-
-        for q in benchmarks:
-            qid = q.get("id", "?")
-            print(f"  [{qid}] {q['question'][:55]}...", end=" ", flush=True)
-            result = run_genie_query(space_id, q["question"])
-
-            generated_sql = (result.get("sql") or "").strip()
-            expected_asset = q.get("expected_asset", "").upper()
-            actual_asset = detect_asset_type(generated_sql) if generated_sql else "NONE"
-            correct = actual_asset == expected_asset
-
-            print(f"{'PASS' if correct else 'FAIL'} (expected={expected_asset}, got={actual_asset})")
-            time.sleep(12)
-
-            mlflow.log_metric(f"q_{qid}_routing", 1.0 if correct else 0.0)
-            results.append({
-                "question_id": qid,
-                "question": q["question"],
-                "correct_asset": correct,
-                "actual_asset": actual_asset,
-                "expected_asset": expected_asset,
-                "generated_sql": generated_sql[:200] if generated_sql else None,
-            })
+        # Per-question metrics are collected here and sent with the summary
+        # metrics in one batch, not as one REST call per question
+        run_metrics = {}
+
+        # Questions still start at most once per GENIE_QUERY_INTERVAL_SECONDS
+        # (the Genie rate limit), but each one's polling overlaps with the
+        # next questions instead of adding to the wall-clock time.
+        pacing_lock = threading.Lock()
+        next_start = time.monotonic()
+
+        def _paced_query(question: str) -> dict:
+            nonlocal next_start
+            with pacing_lock:
+                now = time.monotonic()
+                start_at = max(now, next_start)
+                next_start = start_at + GENIE_QUERY_INTERVAL_SECONDS
+            if start_at > now:
+                time.sleep(start_at - now)
+            return run_genie_query(space_id, question)
+
+        with ThreadPoolExecutor(max_workers=GENIE_EVAL_CONCURRENCY) as pool:
+            futures = [pool.submit(_paced_query, q["question"]) for q in benchmarks]
+            for q, future in zip(benchmarks, futures):
+                qid = q.get("id", "?")
+                print(f"  [{qid}] {q['question'][:55]}...", end=" ", flush=True)
+                result = future.result()
+
+                generated_sql = (result.get("sql") or "").strip()
+                expected_asset = q.get("expected_asset", "").upper()
+                actual_asset = detect_asset_type(generated_sql) if generated_sql else "NONE"
+                correct = actual_asset == expected_asset
+
+                print(f"{'PASS' if correct else 'FAIL'} (expected={expected_asset}, got={actual_asset})")
+
+                run_metrics[f"q_{qid}_routing"] = 1.0 if correct else 0.0
+                if not correct:
+                    failed_ids.append(qid)
+                results.append({
+                    "question_id": qid,
+                    "question": q["question"],
+                    "correct_asset": correct,
+                    "actual_asset": actual_asset,
+                    "expected_asset": expected_asset,
+                    "generated_sql": generated_sql[:200] if generated_sql else None,
+                })
 
         total = len(results)
-        correct_count = sum(1 for r in results if r["correct_asset"])
+        correct_count = total - len(failed_ids)
         accuracy = (correct_count / total * 100) if total else 0
-        failures = [r for r in results if not r["correct_asset"]]
 
-        mlflow.log_metric("asset_routing_rate", correct_count / total if total else 0)
-        mlflow.log_metric("overall_accuracy", accuracy / 100)
-        mlflow.log_metric("questions_passed", correct_count)
-        mlflow.log_metric("questions_failed", len(failures))
+        run_metrics.update({
+            "asset_routing_rate": correct_count / total if total else 0,
+            "overall_accuracy": accuracy / 100,
+            "questions_passed": correct_count,
+            "questions_failed": len(failed_ids),
+        })
+        mlflow.log_metrics(run_metrics)
 
         import tempfile
         import os as _os
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as tmp:
-            json.dump(results, tmp, indent=2, default=str)
-            tmp_path = tmp.name
+        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
+        _os.close(tmp_fd)
+        _write_json_file(tmp_path, results)
         mlflow.log_artifact(tmp_path, artifact_path="evaluation")
         _os.unlink(tmp_path)
 
@@ -1149,13 +1468,13 @@ def run_evaluation_iteration(
     raw_scores = {"asset_accuracy": accuracy / 100}
     return {
         "iteration": iteration,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": _utc_now_iso(),
         "mlflow_run_id": run.info.run_id,
         "overall_accuracy": accuracy,
         "total_questions": total,
         "correct_count": correct_count,
-        "failures": [f["question_id"] for f in failures],
-        "remaining_failures": [f["question_id"] for f in failures],
+        "failures": failed_ids,
+        "remaining_failures": list(failed_ids),
         "scores": _normalize_scores(raw_scores),
         "rows": results,
     }
@@ -1165,6 +1484,9 @@ def run_evaluation_iteration(
 # Job-Based Evaluation (delegates to Evaluator worker patterns)
 # =========================================================================
 
+_RUN_ID_RE = re.compile(r"run_id[:\s]+(\d+)")
+
+
 def trigger_evaluation_job(
     space_id, experiment_name, iteration, benchmarks_path, domain,
     target="dev", job_name="genie_evaluation_job",
@@ -1174,7 +1496,6 @@ def trigger_evaluation_job(
 ):
     """Trigger the genie_evaluation_job via bundle run."""
     import subprocess
-    import re
     import base64
 
     params_str = f"iteration={iteration}"
@@ -1183,7 +1504,7 @@ def trigger_evaluation_job(
     if model_id:
         params_str += f",model_id={model_id}"
     if patched_objects:
-        encoded = base64.b64encode(json.dumps(patched_objects).encode()).decode()
+        encoded = base64.b64encode(_dumps_json(patched_objects)).decode()
         params_str += f",patched_objects_b64={encoded}"
     if eval_dataset_name:
         params_str += f",eval_dataset_name={eval_dataset_name}"
@@ -1200,28 +1521,62 @@ def trigger_evaluation_job(
     if result.returncode != 0:
         return {"status": "TRIGGER_FAILED", "error": result.stderr, "run_id": None}
 
-    run_id_match = re.search(r"run_id[:\s]+(\d+)", result.stdout)
+    run_id_match = _RUN_ID_RE.search(result.stdout)
     run_id = run_id_match.group(1) if run_id_match else None
     print(f"  Job triggered. Run ID: {run_id}")
     return {"status": "TRIGGERED", "run_id": run_id, "stdout": result.stdout}
 
 
-def poll_job_completion(run_id, poll_interval=30, max_wait=3600):
-    """Poll a Databricks job run until it completes or times out."""
+def _jobs_get(method: str, run_id) -> dict | None:
+    """Call jobs.get_run / jobs.get_run_output and return the JSON-shaped dict.
+
+    Uses the in-process WorkspaceClient (no CLI start-up or new connection
+    per poll); falls back to the equivalent `databricks jobs` CLI command.
+    """
+    if w is not None:
+        try:
+            return getattr(w.jobs, method)(run_id=int(run_id)).as_dict()
+        except Exception:
+            pass
     import subprocess
+    cmd = ["databricks", "jobs", method.replace("_", "-"), str(run_id), "--output", "json"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout)
+
+
+def poll_job_completion(run_id, poll_interval=30, max_wait=3600):
+    """Poll a Databricks job run until it completes or times out.
+
+    Polls start 2s apart and back off (x1.6, with +/-10% jitter) up to
+    ``poll_interval`` seconds, restarting from 2s whenever the run changes
+    lifecycle state, so short runs and state changes are noticed quickly
+    without polling long runs more often than before.
+    """
+    import random
 
     print(f"\n--- Polling Job Run {run_id} ---")
     start = time.time()
+    interval = min(2.0, poll_interval)
+    last_lifecycle = None
+
+    def _wait():
+        nonlocal interval
+        time.sleep(interval * random.uniform(0.9, 1.1))
+        interval = min(interval * 1.6, poll_interval)
+
     while time.time() - start < max_wait:
-        cmd = ["databricks", "jobs", "get-run", str(run_id), "--output", "json"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            time.sleep(poll_interval)
+        run_data = _jobs_get("get_run", run_id)
+        if run_data is None:
+            _wait()
             continue
 
-        run_data = json.loads(result.stdout)
         state = run_data.get("state", {})
         lifecycle = state.get("life_cycle_state", "UNKNOWN")
+        if lifecycle != last_lifecycle:
+            last_lifecycle = lifecycle
+            interval = min(2.0, poll_interval)
         elapsed = int(time.time() - start)
         print(f"  [{elapsed}s] lifecycle={lifecycle}")
 
@@ -1231,13 +1586,8 @@ def poll_job_completion(run_id, poll_interval=30, max_wait=3600):
             if tasks:
                 task_run_id = tasks[0].get("run_id")
                 if task_run_id:
-                    out_cmd = [
-                        "databricks", "jobs", "get-run-output",
-                        str(task_run_id), "--output", "json",
-                    ]
-                    out_result = subprocess.run(out_cmd, capture_output=True, text=True)
-                    if out_result.returncode == 0:
-                        out_data = json.loads(out_result.stdout)
+                    out_data = _jobs_get("get_run_output", task_run_id)
+                    if out_data is not None:
                         notebook_output = (
                             out_data.get("notebook_output", {}).get("result", "")
                         )
@@ -1253,7 +1603,7 @@ def poll_job_completion(run_id, poll_interval=30, max_wait=3600):
                 "result_state": state.get("state_message", ""),
                 "notebook_output": None,
             }
-        time.sleep(poll_interval)
+        _wait()
 
     return {
         "life_cycle_state": "TIMEOUT",
@@ -1278,7 +1628,7 @@ def run_evaluation_via_job(
     if trigger["status"] != "TRIGGERED" or not trigger.get("run_id"):
         return {
             "iteration": iteration,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_now_iso(),
             "overall_accuracy": 0,
             "failures": [],
             "remaining_failures": [],
@@ -1290,7 +1640,7 @@ def run_evaluation_via_job(
     if completion["result_state"] != "SUCCESS":
         return {
             "iteration": iteration,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_now_iso(),
             "overall_accuracy": 0,
             "failures": [],
             "remaining_failures": [],
@@ -1302,7 +1652,7 @@ def run_evaluation_via_job(
     job_result = {}
     if notebook_output:
         try:
-            job_result = json.loads(notebook_output)
+            job_result = _loads_json(notebook_output)
         except json.JSONDecodeError:
             pass
 
@@ -1337,28 +1687,24 @@ def run_evaluation_via_job(
             import os as _osmod
             failures_path = _osmod.path.join(artifact_dir, "failures.json")
             if _osmod.path.exists(failures_path):
-                with open(failures_path) as f:
-                    failures_rich = json.load(f)
+                failures_rich = _read_json_file(failures_path)
                 print(f"  Downloaded failures.json: {len(failures_rich)} entries")
 
             arbiter_path = _osmod.path.join(artifact_dir, "arbiter_actions.json")
             if _osmod.path.exists(arbiter_path) and not arbiter_actions:
-                with open(arbiter_path) as f:
-                    arbiter_actions = json.load(f)
+                arbiter_actions = _read_json_file(arbiter_path)
                 print(f"  Downloaded arbiter_actions.json: {len(arbiter_actions)} entries")
 
             if not rows:
                 results_path = _osmod.path.join(artifact_dir, "eval_results.json")
                 if _osmod.path.exists(results_path):
-                    with open(results_path) as f:
-                        rows = json.load(f)
+                    rows = _read_json_file(results_path)
                     print(f"  Downloaded eval_results.json: {len(rows)} rows")
 
             if not repeatability_details:
                 rep_path = _osmod.path.join(artifact_dir, "repeatability.json")
                 if _osmod.path.exists(rep_path):
-                    with open(rep_path) as f:
-                        rep_data = json.load(f)
+                    rep_data = _read_json_file(rep_path)
                     repeatability_pct = rep_data.get("average_repeatability_pct", 0)
                     repeatability_details = rep_data.get("results", [])
                     print(f"  Downloaded repeatability.json: {repeatability_pct:.0f}% avg, "
@@ -1374,7 +1720,7 @@ def run_evaluation_via_job(
 
     result = {
         "iteration": iteration,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": _utc_now_iso(),
         "mlflow_run_id": mlflow_run_id,
         "overall_accuracy": overall_pct,
         "failures": job_result.get("failure_question_ids", []),
@@ -1390,28 +1736,45 @@ def run_evaluation_via_job(
     return result
 
 
+_EXPERIMENT_IDS: dict[str, str] = {}
+
+
+@functools.cache
+def _mlflow_client():
+    return mlflow.tracking.MlflowClient()
+
+
 def query_latest_evaluation(experiment_name, iteration=None):
-    """Query the latest evaluation run from MLflow."""
+    """Query the latest evaluation run from MLflow.
+
+    Uses MlflowClient.search_runs (plain Run objects) rather than
+    mlflow.search_runs, which builds a pandas DataFrame for a single row.
+    """
+    client = _mlflow_client()
+    experiment_id = _EXPERIMENT_IDS.get(experiment_name)
+    if experiment_id is None:
+        experiment = client.get_experiment_by_name(experiment_name)
+        if experiment is None:
+            return None
+        experiment_id = _EXPERIMENT_IDS[experiment_name] = experiment.experiment_id
+
     filter_str = "tags.mlflow.runName LIKE 'genie_eval_%'"
     if iteration is not None:
         filter_str = f"tags.mlflow.runName LIKE 'genie_eval_iter{iteration}_%'"
-    runs = mlflow.search_runs(
-        experiment_names=[experiment_name],
+    runs = client.search_runs(
+        experiment_ids=[experiment_id],
         filter_string=filter_str,
-        order_by=["start_time DESC"],
+        order_by=["attributes.start_time DESC"],
         max_results=1,
     )
-    if runs.empty:
+    if not runs:
         return None
-    row = runs.iloc[0]
+    run = runs[0]
+    metrics = dict(run.data.metrics)
     return {
-        "run_id": row["run_id"],
-        "metrics": {
-            k.replace("metrics.", ""): v
-            for k, v in row.items()
-            if k.startswith("metrics.")
-        },
-        "thresholds_passed": row.get("metrics.thresholds_passed", 0.0) == 1.0,
+        "run_id": run.info.run_id,
+        "metrics": metrics,
+        "thresholds_passed": metrics.get("thresholds_passed", 0.0) == 1.0,
     }
 
 
@@ -1430,7 +1793,7 @@ def generate_report(
     first = iterations[0] if iterations else {}
     last = iterations[-1] if iterations else {}
 
-    report = f"""# {domain.replace('_', ' ').title()} Genie Space Optimization Report
+    parts = [f"""# {domain.replace('_', ' ').title()} Genie Space Optimization Report
 
 **Date:** {date_str}
 **Space ID:** `{progress['space_id']}`
@@ -1448,10 +1811,10 @@ def generate_report(
 
 | Iter | Accuracy | Failures | Proposals Applied |
 |------|----------|----------|-------------------|
-"""
+"""]
     for it in iterations:
         proposals = it.get("proposals_applied", [])
-        report += (
+        parts.append(
             f"| {it.get('iteration', '?')} "
             f"| {it.get('overall_accuracy', 0):.0f}% "
             f"| {len(it.get('failures', []))} "
@@ -1464,9 +1827,11 @@ def generate_report(
     }
     lever_impacts = progress.get("lever_impacts", {})
     if lever_impacts:
-        report += "\n## Per-Lever Impact\n\n"
-        report += "| Lever | Before | After | Delta | Proposals |\n"
-        report += "|-------|--------|-------|-------|-----------|\n"
+        parts.append(
+            "\n## Per-Lever Impact\n\n"
+            "| Lever | Before | After | Delta | Proposals |\n"
+            "|-------|--------|-------|-------|-----------|\n"
+        )
         for lv in ["1", "2", "3", "4", "5", "6"]:
             impact = lever_impacts.get(lv, {})
             if impact:
@@ -1474,13 +1839,13 @@ def generate_report(
                 after_acc = impact.get("after", {}).get("overall_accuracy", 0)
                 delta = impact.get("delta", 0)
                 num_proposals = len(impact.get("proposals", []))
-                report += (
+                parts.append(
                     f"| Lever {lv}: {lever_names.get(lv, '')} "
                     f"| {before_acc:.0f}% | {after_acc:.0f}% | {delta:+.0f}% "
                     f"| {num_proposals} |\n"
                 )
 
-    report += f"""
+    parts.append(f"""
 ## Remaining Failures
 
 {', '.join(progress.get('remaining_failures', [])) or 'None'}
@@ -1495,10 +1860,10 @@ def generate_report(
 - [ ] Review remaining failures
 - [ ] Deploy bundle if not yet deployed
 - [ ] Schedule follow-up optimization session
-"""
+""")
 
     with open(filename, "w") as f:
-        f.write(report)
+        f.write("".join(parts))
     print(f"\nReport saved to: {filename}")
     return filename
 
@@ -1510,6 +1875,9 @@ def generate_report(
 def deploy_bundle_and_run_genie_job(target="dev", genie_job="genie_spaces_deployment_job"):
     import subprocess
 
+    # The deployment job rewrites space configs; don't serve stale copies
+    _invalidate_space_config()
+
     print("\n--- Phase B: Bundle Validate + Deploy ---\n")
     validate = subprocess.run(
         ["databricks", "bundle", "validate", "-t", target],
@@ -1763,6 +2131,27 @@ def run_optimization_loop(
     return progress
 
 
+# Variance classes that become synthetic failures, and their severity
+_REPEATABILITY_SEVERITY = {
+    "CRITICAL_VARIANCE": "critical",
+    "SIGNIFICANT_VARIANCE": "major",
+}
+
+# Counterfactual fix for a non-repeatable question, by the asset its SQL used
+_REPEATABILITY_COUNTERFACTUALS = {
+    "MV": (
+        "Add structured column metadata (business_definition, synonyms, grain) "
+        "to underlying tables; convert to TVF if variance persists"
+    ),
+    "TVF": "Add instruction clarifying deterministic parameter selection for TVF",
+}
+_DEFAULT_REPEATABILITY_COUNTERFACTUAL = (
+    "Add structured metadata (business_definition, synonyms, join_keys, "
+    "do_not_use_when) to table/column comments and UC tags "
+    "(preferred_for_genie, domain)"
+)
+
+
 def _synthesize_repeatability_failures(repeatability_details: list) -> list:
     """Convert non-repeatable questions into synthetic failure rows for the optimizer.
 
@@ -1774,22 +2163,11 @@ def _synthesize_repeatability_failures(repeatability_details: list) -> list:
     synthetic_rows = []
     for detail in repeatability_details:
         classification = detail.get("classification", "IDENTICAL")
-        if classification not in ("CRITICAL_VARIANCE", "SIGNIFICANT_VARIANCE"):
+        severity = _REPEATABILITY_SEVERITY.get(classification)
+        if severity is None:
             continue
         asset = detail.get("dominant_asset", "TABLE")
-        if asset == "MV":
-            counterfactual = (
-                "Add structured column metadata (business_definition, synonyms, grain) "
-                "to underlying tables; convert to TVF if variance persists"
-            )
-        elif asset == "TVF":
-            counterfactual = "Add instruction clarifying deterministic parameter selection for TVF"
-        else:
-            counterfactual = (
-                "Add structured metadata (business_definition, synonyms, join_keys, "
-                "do_not_use_when) to table/column comments and UC tags "
-                "(preferred_for_genie, domain)"
-            )
+        counterfactual = _REPEATABILITY_COUNTERFACTUALS.get(asset, _DEFAULT_REPEATABILITY_COUNTERFACTUAL)
         synthetic_rows.append({
             "inputs/question_id": detail.get("question_id", ""),
             "inputs/question": detail.get("question", ""),
@@ -1800,15 +2178,41 @@ def _synthesize_repeatability_failures(repeatability_details: list) -> list:
                 f"({detail.get('repeatability_pct', 0):.0f}% repeatability, asset={asset})"
             ),
             "metadata/repeatability/failure_type": "repeatability_issue",
-            "metadata/repeatability/severity": (
-                "critical" if classification == "CRITICAL_VARIANCE" else "major"
-            ),
+            "metadata/repeatability/severity": severity,
             "metadata/repeatability/blame_set": asset,
             "metadata/repeatability/counterfactual_fix": counterfactual,
         })
     return synthetic_rows
 
 
+def _sql_hash(sql: str) -> str:
+    """Short fingerprint of a generated SQL string, ignoring case and padding.
+
+    Only compared with other _sql_hash values from the same run, so a 4-byte
+    blake2b digest (8 hex chars) stands in for truncated MD5.
+    """
+    if not sql:
+        return "NONE"
+    return hashlib.blake2b(sql.strip().lower().encode(), digest_size=4).hexdigest()
+
+
+_NEGATIVE_FEEDBACK = frozenset(("no", "false", "0"))
+
+
+def _row_question_id(row: dict) -> str:
+    """Question key of an eval row (judge-harness or inline format)."""
+    return (
+        row.get("inputs/question_id")
+        or row.get("question_id")
+        or row.get("inputs/question", "")
+    )
+
+
+def _row_sql(row: dict) -> str:
+    """Generated SQL of an eval row (judge-harness or inline format)."""
+    return row.get("outputs/response", "") or row.get("response", "")
+
+
 def _compute_cross_iteration_repeatability(current_rows: list, previous_rows: list) -> dict:
     """Compare SQL outputs between two iterations to detect instability.
 
@@ -1823,38 +2227,28 @@ def _compute_cross_iteration_repeatability(current_rows: list, previous_rows: li
         details: list of per-question dicts
         unstable_details: list of dicts for questions that changed SQL
     """
-    def _sql_hash(sql: str) -> str:
-        if not sql:
-            return "NONE"
-        return hashlib.md5(sql.strip().lower().encode()).hexdigest()[:8]
-
-    prev_map = {}
-    for row in previous_rows:
-        qid = (
-            row.get("inputs/question_id")
-            or row.get("question_id")
-            or row.get("inputs/question", "")
+    # qid -> (sql_hash, was_correct); plain tuples, one pass over the rows
+    prev_map = {
+        _row_question_id(row): (
+            _sql_hash(_row_sql(row)),
+            str(row.get("feedback/result_correctness", "")).lower() not in _NEGATIVE_FEEDBACK,
         )
-        sql = row.get("outputs/response", "") or row.get("response", "")
-        was_correct = str(row.get("feedback/result_correctness", "")).lower() not in ("no", "false", "0")
-        prev_map[qid] = {"hash": _sql_hash(sql), "was_correct": was_correct}
+        for row in previous_rows
+    }
 
     details = []
     unstable = []
     matched_count = 0
 
     for row in current_rows:
-        qid = (
-            row.get("inputs/question_id")
-            or row.get("question_id")
-            or row.get("inputs/question", "")
-        )
-        if not qid or qid not in prev_map:
+        qid = _row_question_id(row)
+        prev_entry = prev_map.get(qid) if qid else None
+        if prev_entry is None:
             continue
-        sql = row.get("outputs/response", "") or row.get("response", "")
+        prev_hash, was_correct = prev_entry
+        sql = _row_sql(row)
         curr_hash = _sql_hash(sql)
-        prev_entry = prev_map[qid]
-        is_match = curr_hash == prev_entry["hash"]
+        is_match = curr_hash == prev_hash
         if is_match:
             matched_count += 1
 
@@ -1864,9 +2258,9 @@ def _compute_cross_iteration_repeatability(current_rows: list, previous_rows: li
             "question": row.get("inputs/question", ""),
             "matched": is_match,
             "current_hash": curr_hash,
-            "prev_hash": prev_entry["hash"],
+            "prev_hash": prev_hash,
             "dominant_asset": asset,
-            "was_previously_correct": prev_entry["was_correct"],
+            "was_previously_correct": was_correct,
         }
         details.append(entry)
         if not is_match:
@@ -1897,19 +2291,7 @@ def _synthesize_repeatability_failures_from_cross_iter(unstable_details: list) -
         if detail.get("was_previously_correct") is False:
             continue
         asset = detail.get("dominant_asset", "TABLE")
-        if asset == "MV":
-            counterfactual = (
-                "Add structured column metadata (business_definition, synonyms, grain) "
-                "to underlying tables; convert to TVF if variance persists"
-            )
-        elif asset == "TVF":
-            counterfactual = "Add instruction clarifying deterministic parameter selection for TVF"
-        else:
-            counterfactual = (
-                "Add structured metadata (business_definition, synonyms, join_keys, "
-                "do_not_use_when) to table/column comments and UC tags "
-                "(preferred_for_genie, domain)"
-            )
+        counterfactual = _REPEATABILITY_COUNTERFACTUALS.get(asset, _DEFAULT_REPEATABILITY_COUNTERFACTUAL)
         synthetic_rows.append({
             "inputs/question_id": detail.get("question_id", ""),
             "inputs/question": detail.get("question", ""),
@@ -1971,7 +2353,7 @@ def _run_lever_aware_loop(
             return
         try:
             with open(benchmarks_path) as _bf:
-                _all = yaml.safe_load(_bf) or {}
+                _all = _safe_load(_bf) or {}
         except Exception as _read_err:
             print(f"  WARNING: Could not read benchmarks YAML for corrections: {_read_err}")
             return
@@ -2011,7 +2393,7 @@ def _run_lever_aware_loop(
             return
 
         with open(benchmarks_path, "w") as _wf:
-            yaml.dump(_all, _wf, default_flow_style=False, sort_keys=False)
+            yaml.dump(_all, _wf, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
         print(f"  Applied {_updated} arbiter benchmark corrections to YAML.")
         print("  UC dataset will be re-synced by the evaluator job on next run.")
 
@@ -2060,6 +2442,9 @@ def _run_lever_aware_loop(
         print("=" * 60)
 
         metadata_snapshot = _fetch_space_config(space_id) or {}
+        # Cross-iteration repeatability only depends on the last two
+        # iterations; levers that add no iteration reuse the comparison
+        cross_rep_cache = {}
 
         for lever in [1, 2, 3, 4, 5]:
             if all_thresholds_met(prev_scores):
@@ -2097,7 +2482,11 @@ def _run_lever_aware_loop(
                 prev_rows = progress["iterations"][-2].get("rows", [])
                 curr_rows = eval_results_for_optimizer.get("rows", [])
                 if prev_rows and curr_rows:
-                    cross_rep = _compute_cross_iteration_repeatability(curr_rows, prev_rows)
+                    cache_key = len(progress["iterations"])
+                    cross_rep = cross_rep_cache.get(cache_key)
+                    if cross_rep is None:
+                        cross_rep = _compute_cross_iteration_repeatability(curr_rows, prev_rows)
+                        cross_rep_cache = {cache_key: cross_rep}
                     progress["cross_iteration_repeatability"] = cross_rep["avg_pct"]
                     print(f"  Cross-iteration repeatability: {cross_rep['avg_pct']:.0f}% "
                           f"({cross_rep['changed']} questions changed SQL)")
@@ -2130,7 +2519,10 @@ def _run_lever_aware_loop(
             pending_apply_log = None
             if progress.get("use_patch_dsl", True):
                 try:
-                    current_config = _fetch_space_config(space_id) or metadata_snapshot or {}
+                    current_config = (
+                        _fetch_space_config(space_id, max_age=_ITERATION_SCOPED)
+                        or metadata_snapshot or {}
+                    )
                     patches = _proposals_to_patches(proposals)
                     pending_apply_log = _apply_patch_set(
                         space_id,
@@ -2153,8 +2545,7 @@ def _run_lever_aware_loop(
                 rollback_to_model(prev_model_id, space_id)
                 continue
 
-            print("  Waiting 30s for propagation...")
-            time.sleep(30)
+            _wait_for_propagation(space_id)
 
             iter_num = _next_iter()
             model_id = _snapshot_fn(iter_num, patch_set=proposals, prompt_versions=None)
@@ -2230,6 +2621,7 @@ def _run_lever_aware_loop(
                 if _lever_apply_log and progress.get("use_patch_dsl", True):
                     try:
                         _rollback(_lever_apply_log, space_id)
+                        _invalidate_space_config(space_id)
                         print("  Patch DSL rollback successful.")
                     except Exception as e:
                         print(f"  WARNING: Patch DSL rollback failed: {e}")
@@ -2245,7 +2637,9 @@ def _run_lever_aware_loop(
             prev_accuracy = lever_accuracy
             prev_model_id = model_id
 
-            metadata_snapshot = _fetch_space_config(space_id) or metadata_snapshot
+            metadata_snapshot = (
+                _fetch_space_config(space_id, max_age=_ITERATION_SCOPED) or metadata_snapshot
+            )
 
         # ── Phase 3: GEPA for Lever 6 ────────────────────────────
         if not all_thresholds_met(prev_scores) and iteration_counter < max_iterations:
@@ -2290,7 +2684,10 @@ def _run_lever_aware_loop(
                     print(f"  GEPA produced {len(gepa_result)} patches.")
                     if progress.get("use_patch_dsl", True):
                         try:
-                            current_config = _fetch_space_config(space_id) or metadata_snapshot or {}
+                            current_config = (
+                                _fetch_space_config(space_id, max_age=_ITERATION_SCOPED)
+                                or metadata_snapshot or {}
+                            )
                             apply_results = _apply_patch_set(
                                 space_id,
                                 gepa_result,
@@ -2309,8 +2706,7 @@ def _run_lever_aware_loop(
                             [{"proposal_id": f"GEPA_{i}", "lever": 6, "change_description": f"GEPA patch: {p.get('type', 'unknown')}", "dual_persistence": {"api": "PATCH /api/2.0/genie/spaces/{space_id}", "repo": f"src/genie/{domain}_genie_export.json"}} for i, p in enumerate(gepa_result)],
                             space_id, domain,
                         )
-                    print("  Waiting 30s for propagation...")
-                    time.sleep(30)
+                    _wait_for_propagation(space_id)
 
                     iter_num = _next_iter()
                     model_id = _snapshot_fn(iter_num, patch_set=gepa_result)
@@ -2489,12 +2885,12 @@ def main():
 
     if args.discover:
         print("Discovering Genie Spaces...\n")
-        spaces = discover_spaces()
-        if not spaces:
+        found = 0
+        for s in discover_spaces():
+            print(f"  {s['id']}  {s['title']}", flush=True)
+            found += 1
+        if not found:
             print("No Genie Spaces found.")
-            return
-        for s in spaces:
-            print(f"  {s['id']}  {s['title']}")
         return
 
     if not args.space_id:
@@ -2503,7 +2899,7 @@ def main():
         parser.error("--benchmarks is required")
 
     with open(args.benchmarks) as f:
-        all_benchmarks = yaml.safe_load(f)
+        all_benchmarks = _safe_load(f)
 
     if args.domain in all_benchmarks:
         benchmarks = all_benchmarks[args.domain]
@@ -120,6 +120,25 @@ def test_update_progress():
     assert len(progress["iterations"]) == 1
     assert progress["best_overall_accuracy"] == 66.0
     assert progress["best_iteration"] == 1
+
+    # Consecutive duplicates (repeatability re-runs) are not re-recorded
+    patches_a = [{"type": "add_synonym", "target": "revenue_facts"}]
+    patches_b = [{"type": "add_comment", "target": "customer_dim"}]
+    scores_b = {"asset_routing": 0.80, "schema_accuracy": 0.70}
+    update_progress(progress, {**MOCK_EVAL_RESULT, "iteration": 2, "patch_set": patches_a})
+    update_progress(progress, {**MOCK_EVAL_RESULT, "iteration": 3, "patch_set": patches_a})
+    assert len(progress["iterations"]) == 3
+    assert [h["iteration"] for h in progress["score_history"]] == [1]
+    assert [h["iteration"] for h in progress["patch_history"]] == [2]
+
+    # A repeat that is not consecutive is kept
+    update_progress(progress, {**MOCK_EVAL_RESULT, "iteration": 4, "scores": scores_b,
+                               "patch_set": patches_b})
+    update_progress(progress, {**MOCK_EVAL_RESULT, "iteration": 5, "patch_set": patches_a})
+    assert [h["iteration"] for h in progress["score_history"]] == [1, 4, 5]
+    assert [h["iteration"] for h in progress["patch_history"]] == [2, 4, 5]
+    assert progress["score_history"][-1]["scores"] == MOCK_EVAL_RESULT["scores"]
+    assert progress["patch_history"][-1]["patches"] == patches_a
     print("  PASS: update_progress")
 
 
@@ -229,6 +248,49 @@ def test_worker_import_wiring():
     print("  PASS: worker import wiring")
 
 
+def test_space_config_cache():
+    """Test space config caching: reuse, copy isolation, and invalidation."""
+    import copy
+    import orchestrator
+
+    mock_w = MagicMock()
+    mock_w.api_client.do.side_effect = lambda *a, **kw: copy.deepcopy(MOCK_SPACE_CONFIG)
+    gets = mock_w.api_client.do
+
+    orchestrator._invalidate_space_config()
+    try:
+        with patch.object(orchestrator, "w", mock_w):
+            first = orchestrator._fetch_space_config("space_1")
+            first["data_assets"].clear()
+            second = orchestrator._fetch_space_config("space_1")
+            third = orchestrator._fetch_space_config(
+                "space_1", max_age=orchestrator._ITERATION_SCOPED,
+            )
+            assert gets.call_count == 1
+            assert second == MOCK_SPACE_CONFIG
+            assert third == MOCK_SPACE_CONFIG and third is not second
+
+            with patch.object(orchestrator, "PROPAGATION_WAIT_SECONDS", 0):
+                orchestrator._wait_for_propagation("space_1")
+            orchestrator._fetch_space_config("space_1", max_age=orchestrator._ITERATION_SCOPED)
+            assert gets.call_count == 2
+
+            with patch.object(orchestrator, "_model_source_run_id", return_value=None):
+                assert orchestrator.rollback_to_model("model_1", "space_1") is None
+            orchestrator._fetch_space_config("space_1", max_age=orchestrator._ITERATION_SCOPED)
+            assert gets.call_count == 3
+
+            failed = MagicMock(returncode=1, stdout="", stderr="invalid bundle")
+            with patch("subprocess.run", return_value=failed):
+                result = orchestrator.deploy_bundle_and_run_genie_job()
+            assert result["status"] == "VALIDATE_FAILED"
+            orchestrator._fetch_space_config("space_1", max_age=orchestrator._ITERATION_SCOPED)
+            assert gets.call_count == 4
+    finally:
+        orchestrator._invalidate_space_config()
+    print("  PASS: space config cache")
+
+
 def test_asi_aware_clustering():
     """Test that cluster_failures prefers ASI metadata when available."""
     optimizer_path = Path(__file__).parent.parent.parent / "genie-optimization-workers" / "03-genie-metadata-optimizer" / "scripts"
@@ -403,6 +465,7 @@ def run_all():
         test_verify_dual_persistence,
         test_lever_aware_loop_structure,
         test_worker_import_wiring,
+        test_space_config_cache,
         test_asi_aware_clustering,
         test_repeatability_integration,
     ]